@@ -0,0 +1,67 @@
+"""
+Compare serialising a large ev42 message with and without builder pre-allocation.
+
+Each case runs in a fresh process so the peak RSS figures are independent.
+
+Usage:
+    python -m benchmarks.benchmark_ev42_preallocation [number_of_events]
+"""
+
+import multiprocessing
+import resource
+import sys
+import time
+import flatbuffers
+import numpy as np
+import streaming_data_types.eventdata_ev42 as eventdata_ev42
+
+
+def _run(number_of_events, presize, results):
+    if not presize:
+        # Start from the fixed size builder that was used before size estimation
+        eventdata_ev42._estimate_message_size = lambda *args: 1024
+
+    reallocations = 0
+    grow_byte_buffer = flatbuffers.Builder.growByteBuffer
+
+    def counting_grow_byte_buffer(builder):
+        nonlocal reallocations
+        reallocations += 1
+        grow_byte_buffer(builder)
+
+    flatbuffers.Builder.growByteBuffer = counting_grow_byte_buffer
+
+    time_of_flight = np.arange(number_of_events, dtype=np.uint32)
+    detector_id = np.arange(number_of_events, dtype=np.uint32)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    eventdata_ev42.serialise_ev42(
+        "some_source", 1, 2, time_of_flight, detector_id, copy=False
+    )
+    duration = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((reallocations, (peak_rss - baseline_rss) / 1024, duration))
+
+
+def main(number_of_events):
+    context = multiprocessing.get_context("spawn")
+    print(f"Serialising {number_of_events} events")
+    for presize in (False, True):
+        results = context.Queue()
+        process = context.Process(
+            target=_run, args=(number_of_events, presize, results)
+        )
+        process.start()
+        reallocations, peak_rss_increase_mb, duration = results.get()
+        process.join()
+        label = "estimated size" if presize else "1024 byte start"
+        print(
+            f"{label:>16}: {reallocations:3d} reallocations, "
+            f"peak RSS increase {peak_rss_increase_mb:7.1f} MB, {duration:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,55 @@
+"""
+Measure the time to serialise scalar f142 messages with serialise_f142, for native
+and NumPy values, with an F142ScalarEncoder directly and with serialise_f142_batch
+for 1000 sources.
+
+Usage:
+    python -m benchmarks.benchmark_f142_scalar [number_of_messages]
+"""
+
+import sys
+import timeit
+import numpy as np
+from streaming_data_types.logdata_f142 import (
+    F142ScalarEncoder,
+    serialise_f142,
+    serialise_f142_batch,
+)
+
+BATCH_SIZE = 10_000
+
+
+def main(number_of_messages):
+    encoder = F142ScalarEncoder("some_source")
+    cases = {
+        "float": lambda: serialise_f142(1.234, "some_source", 123456),
+        "np.float64": lambda: serialise_f142(np.float64(1.234), "some_source", 123456),
+        "int": lambda: serialise_f142(1234, "some_source", 123456),
+        "0-d array": lambda: serialise_f142(np.array(1.234), "some_source", 123456),
+        "F142ScalarEncoder": lambda: encoder.encode(1.234, 123456),
+    }
+    print(f"Serialising {number_of_messages} scalar doubles")
+    for label, serialise in cases.items():
+        duration = timeit.timeit(serialise, number=number_of_messages)
+        print(f"{label:>18}: {duration / number_of_messages * 1e6:6.2f} us/message")
+
+    source_names = [f"source_{i % 1000}" for i in range(BATCH_SIZE)]
+    values = np.random.default_rng(0).random(BATCH_SIZE)
+    timestamps = np.arange(BATCH_SIZE, dtype=np.uint64)
+    number_of_batches = max(number_of_messages // BATCH_SIZE, 1)
+    # Build the sources' cached templates first
+    serialise_f142_batch(source_names, values, timestamps)
+    for packed in (False, True):
+        duration = timeit.timeit(
+            lambda: serialise_f142_batch(
+                source_names, values, timestamps, packed=packed
+            ),
+            number=number_of_batches,
+        )
+        label = "packed batch" if packed else "batch"
+        per_message = duration / (number_of_batches * BATCH_SIZE)
+        print(f"{label:>18}: {per_message * 1e6:6.2f} us/message")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,46 @@
+"""
+Measure the time to import the package, which imports schema modules lazily, and
+to import it and load every schema module.
+
+Each import is timed in a fresh interpreter so nothing has been imported already,
+and the fastest of the repeats is reported.
+
+Usage:
+    python -m benchmarks.benchmark_import [number_of_repeats]
+"""
+
+import subprocess
+import sys
+
+
+def _time_import(statement):
+    return float(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import time; start = time.perf_counter(); "
+                f"{statement}; print(time.perf_counter() - start)",
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+    )
+
+
+def main(number_of_repeats):
+    cases = {
+        "package": "import streaming_data_types",
+        "all schemas": "import streaming_data_types; "
+        "[streaming_data_types.SERIALISERS[schema] "
+        "for schema in streaming_data_types.SERIALISERS]",
+    }
+    print(f"Fastest of {number_of_repeats} imports")
+    for label, statement in cases.items():
+        duration = min(_time_import(statement) for _ in range(number_of_repeats))
+        print(f"{label:>12}: {duration * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
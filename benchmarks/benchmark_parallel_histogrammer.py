@@ -0,0 +1,75 @@
+"""
+Measure ev42 histogramming throughput for increasing numbers of worker processes.
+
+The single process EventHistogrammer is included as the baseline. Scaling is limited
+by the number of CPUs and by the parent process copying messages into shared memory.
+
+Usage:
+    python -m benchmarks.benchmark_parallel_histogrammer [number_of_messages]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+from streaming_data_types.event_histogrammer import EventHistogrammer
+from streaming_data_types.eventdata_ev42 import serialise_ev42
+from streaming_data_types.parallel_histogrammer import ParallelEventHistogrammer
+
+EVENTS_PER_MESSAGE = 200_000
+TOF_EDGES = np.linspace(0, 100_000, 1001)
+DETECTOR_EDGES = np.arange(0, 10_001)
+
+
+def _make_messages(number_of_messages):
+    rng = np.random.default_rng(0)
+    return [
+        serialise_ev42(
+            "some_source",
+            message_id,
+            message_id,
+            rng.integers(0, 100_000, EVENTS_PER_MESSAGE).astype(np.uint32),
+            rng.integers(0, 10_000, EVENTS_PER_MESSAGE).astype(np.uint32),
+        )
+        for message_id in range(number_of_messages)
+    ]
+
+
+def _time_histogrammer(histogrammer, messages):
+    # Warm up first so page faults on the new histograms are not measured
+    histogrammer.add_ev42(messages[0])
+    histogrammer.counts
+    histogrammer.reset()
+    start = time.perf_counter()
+    for message in messages:
+        histogrammer.add_ev42(message)
+    # Reading the counts waits for, and merges, the workers' results
+    histogrammer.counts
+    return time.perf_counter() - start
+
+
+def main(number_of_messages):
+    messages = _make_messages(number_of_messages)
+    number_of_events = number_of_messages * EVENTS_PER_MESSAGE
+    print(f"Histogramming {number_of_events} events on {os.cpu_count()} CPUs")
+
+    duration = _time_histogrammer(
+        EventHistogrammer(TOF_EDGES, DETECTOR_EDGES), messages
+    )
+    print(
+        f"{'single process':>16}: {number_of_events / duration / 1e6:7.1f} M events/s"
+    )
+
+    number_of_workers = 1
+    while number_of_workers <= max(os.cpu_count() or 1, 1):
+        with ParallelEventHistogrammer(
+            TOF_EDGES, DETECTOR_EDGES, number_of_workers=number_of_workers
+        ) as histogrammer:
+            duration = _time_histogrammer(histogrammer, messages)
+        label = f"{number_of_workers} workers"
+        print(f"{label:>16}: {number_of_events / duration / 1e6:7.1f} M events/s")
+        number_of_workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -1,44 +1,113 @@
-from streaming_data_types.eventdata_ev42 import deserialise_ev42, serialise_ev42
-from streaming_data_types.histogram_hs00 import deserialise_hs00, serialise_hs00
-from streaming_data_types.logdata_f142 import deserialise_f142, serialise_f142
-from streaming_data_types.nicos_cache_ns10 import deserialise_ns10, serialise_ns10
-from streaming_data_types.run_start_pl72 import deserialise_pl72, serialise_pl72
-from streaming_data_types.run_stop_6s4t import deserialise_6s4t, serialise_6s4t
-from streaming_data_types.status_x5f2 import deserialise_x5f2, serialise_x5f2
-from streaming_data_types.epics_connection_info_ep00 import (
-    deserialise_ep00,
-    serialise_ep00,
-)
-from streaming_data_types.timestamps_tdct import deserialise_tdct, serialise_tdct
-from streaming_data_types.forwarder_config_update_rf5k import (
-    deserialise_rf5k,
-    serialise_rf5k,
-)
-
-
-SERIALISERS = {
-    "ev42": serialise_ev42,
-    "hs00": serialise_hs00,
-    "f142": serialise_f142,
-    "ns10": serialise_ns10,
-    "pl72": serialise_pl72,
-    "6s4t": serialise_6s4t,
-    "x5f2": serialise_x5f2,
-    "ep00": serialise_ep00,
-    "tdct": serialise_tdct,
-    "rf5k": serialise_rf5k,
+import importlib
+import sys
+from collections.abc import Mapping
+
+
+# The schema modules are only imported when one of their functions is first used,
+# so importing the package does not pay for every schema's generated code and numpy
+_SCHEMA_MODULES = {
+    "ev42": "eventdata_ev42",
+    "hs00": "histogram_hs00",
+    "f142": "logdata_f142",
+    "ns10": "nicos_cache_ns10",
+    "pl72": "run_start_pl72",
+    "6s4t": "run_stop_6s4t",
+    "x5f2": "status_x5f2",
+    "ep00": "epics_connection_info_ep00",
+    "tdct": "timestamps_tdct",
+    "rf5k": "forwarder_config_update_rf5k",
 }
 
 
-DESERIALISERS = {
-    "ev42": deserialise_ev42,
-    "hs00": deserialise_hs00,
-    "f142": deserialise_f142,
-    "ns10": deserialise_ns10,
-    "pl72": deserialise_pl72,
-    "6s4t": deserialise_6s4t,
-    "x5f2": deserialise_x5f2,
-    "ep00": deserialise_ep00,
-    "tdct": deserialise_tdct,
-    "rf5k": deserialise_rf5k,
+def _load_function(schema: str, prefix: str):
+    module = importlib.import_module(f"{__name__}.{_SCHEMA_MODULES[schema]}")
+    return getattr(module, f"{prefix}_{schema}")
+
+
+class _LazySchemaFunctions(Mapping):
+    """
+    Read-only mapping of schema identifier to function that imports on first use.
+    """
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+        self._functions = {}
+
+    def __getitem__(self, schema: str):
+        try:
+            return self._functions[schema]
+        except KeyError:
+            function = _load_function(schema, self._prefix)
+            self._functions[schema] = function
+            return function
+
+    def __contains__(self, schema) -> bool:
+        return schema in _SCHEMA_MODULES
+
+    def __iter__(self):
+        return iter(_SCHEMA_MODULES)
+
+    def __len__(self) -> int:
+        return len(_SCHEMA_MODULES)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(_SCHEMA_MODULES)})"
+
+
+SERIALISERS = _LazySchemaFunctions("serialise")
+
+
+DESERIALISERS = _LazySchemaFunctions("deserialise")
+
+
+_PUBLIC_FUNCTIONS = {
+    f"{prefix}_{schema}": (schema, prefix)
+    for schema in _SCHEMA_MODULES
+    for prefix in ("serialise", "deserialise")
 }
+
+
+# Star imports get the schema functions through __getattr__
+__all__ = ["SERIALISERS", "DESERIALISERS", "deserialise", *_PUBLIC_FUNCTIONS]
+
+
+def __getattr__(name: str):
+    try:
+        schema, prefix = _PUBLIC_FUNCTIONS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    function = SERIALISERS[schema] if prefix == "serialise" else DESERIALISERS[schema]
+    globals()[name] = function
+    return function
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_PUBLIC_FUNCTIONS))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported, so import everything up front
+    for _name in _PUBLIC_FUNCTIONS:
+        __getattr__(_name)
+
+
+# Keyed on the raw identifier bytes so messages can be routed without decoding
+_SCHEMAS_BY_IDENTIFIER = {schema.encode(): schema for schema in _SCHEMA_MODULES}
+
+
+def deserialise(buffer):
+    """
+    Deserialise a FlatBuffers message of any supported schema.
+
+    The message is routed on its schema identifier, so this is useful for consuming
+    from topics that carry more than one schema.
+
+    :param buffer: The FlatBuffers buffer.
+    :return: The deserialised data, as returned by the schema's deserialiser.
+    """
+    identifier = bytes(buffer[4:8])
+    try:
+        schema = _SCHEMAS_BY_IDENTIFIER[identifier]
+    except KeyError:
+        raise RuntimeError(f"Unsupported schema: {identifier}") from None
+    return DESERIALISERS[schema](buffer, check_identifier=False)
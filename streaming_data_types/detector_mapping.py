@@ -0,0 +1,139 @@
+from typing import Union
+import numpy as np
+from streaming_data_types.eventdata_ev42 import EventData
+from streaming_data_types.run_start_pl72 import DetectorSpectrumMap, deserialise_pl72
+
+UNMAPPED = -1
+
+
+class DetectorMapping:
+    """
+    Maps detector ids to other indices, e.g. spectrum numbers or pixel indices.
+
+    The mapping is compiled into a dense lookup array covering the range of the
+    detector ids, so a whole array of ids is mapped with a single NumPy gather. If
+    the ids are spread over a range too large for that, the mapping falls back to a
+    binary search of the sorted ids. Ids that are not in the mapping map to UNMAPPED.
+    """
+
+    def __init__(self, detector_ids, values, max_dense_size: int = 1 << 24):
+        """
+        :param detector_ids: the detector ids to map from
+        :param values: the index that each detector id maps to
+        :param max_dense_size: the largest dense lookup array to use
+        """
+        detector_ids = np.asarray(detector_ids, dtype=np.int64).reshape(-1)
+        values = np.asarray(values).reshape(-1)
+        if len(detector_ids) != len(values):
+            raise ValueError(
+                f"{len(detector_ids)} detector ids but {len(values)} values"
+            )
+        if values.dtype.kind not in "iu":
+            raise ValueError("Mapped values must be integers")
+        values = values.astype(np.int64)
+
+        order = np.argsort(detector_ids, kind="stable")
+        self._sorted_ids = detector_ids[order]
+        self._sorted_values = values[order]
+        if np.any(np.diff(self._sorted_ids) == 0):
+            raise ValueError("Detector ids must be unique")
+
+        self._table = None
+        if len(detector_ids):
+            self._first_id = self._sorted_ids[0]
+            size = self._sorted_ids[-1] - self._first_id + 1
+            if size <= max_dense_size:
+                # Padded with an unmapped entry at each end for ids out of range
+                self._table = np.full(size + 2, UNMAPPED, dtype=np.int64)
+                self._table[self._sorted_ids - self._first_id + 1] = self._sorted_values
+
+    @classmethod
+    def from_dict(cls, mapping: dict, **kwargs) -> "DetectorMapping":
+        """
+        :param mapping: a dictionary of detector id to index
+        :return: the compiled mapping
+        """
+        return cls(
+            np.fromiter(mapping.keys(), dtype=np.int64, count=len(mapping)),
+            np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping)),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_pl72(
+        cls, buffer: Union[bytearray, bytes], check_identifier: bool = True, **kwargs
+    ) -> "DetectorMapping":
+        """
+        Get the detector id to spectrum number mapping of a run start message.
+
+        :param buffer: the pl72 FlatBuffers buffer
+        :param check_identifier: whether to check the buffer's schema identifier
+        :return: the compiled mapping
+        """
+        spectrum_map = deserialise_pl72(buffer, check_identifier).detector_spectrum_map
+        if spectrum_map is None:
+            raise ValueError("Run start message has no detector-spectrum map")
+        return cls.from_detector_spectrum_map(spectrum_map, **kwargs)
+
+    @classmethod
+    def from_detector_spectrum_map(
+        cls, detector_spectrum_map: DetectorSpectrumMap, **kwargs
+    ) -> "DetectorMapping":
+        """
+        :param detector_spectrum_map: a deserialised pl72 detector-spectrum map
+        :return: the compiled detector id to spectrum number mapping
+        """
+        return cls(
+            detector_spectrum_map.detector_ids,
+            detector_spectrum_map.spectrum_numbers,
+            **kwargs,
+        )
+
+    @property
+    def is_dense(self) -> bool:
+        """
+        Whether the mapping uses a dense lookup array
+        """
+        return self._table is not None
+
+    def __len__(self):
+        return len(self._sorted_ids)
+
+    def map(self, detector_id) -> np.ndarray:
+        """
+        Map detector ids.
+
+        :param detector_id: the detector ids
+        :return: the mapped indices, UNMAPPED for ids not in the mapping
+        """
+        detector_id = np.asarray(detector_id, dtype=np.int64)
+        if self._table is not None:
+            index = detector_id - (self._first_id - 1)
+            np.clip(index, 0, len(self._table) - 1, out=index)
+            return self._table[index]
+
+        if not len(self._sorted_ids):
+            return np.full(detector_id.shape, UNMAPPED, dtype=np.int64)
+        index = np.searchsorted(self._sorted_ids, detector_id)
+        np.minimum(index, len(self._sorted_ids) - 1, out=index)
+        return np.where(
+            self._sorted_ids[index] == detector_id,
+            self._sorted_values[index],
+            UNMAPPED,
+        )
+
+    def map_event_data(self, event_data) -> EventData:
+        """
+        Map the detector ids of a deserialised ev42 message.
+
+        :param event_data: an EventData or EventDataView
+        :return: an EventData with the mapped indices as its detector ids
+        """
+        return EventData(
+            event_data.source_name,
+            event_data.message_id,
+            event_data.pulse_time,
+            event_data.time_of_flight,
+            self.map(event_data.detector_id),
+            event_data.specific_data,
+        )
@@ -1,10 +1,13 @@
 from typing import Union, Optional
-import flatbuffers
 from streaming_data_types.fbschemas.epics_connection_info_ep00 import (
     EpicsConnectionInfo,
     EventType,
 )
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+)
 from collections import namedtuple
 
 FILE_IDENTIFIER = b"ep00"
@@ -16,7 +19,7 @@ def serialise_ep00(
     source_name: str,
     service_id: Optional[str] = None,
 ) -> bytes:
-    builder = flatbuffers.Builder(136)
+    builder = get_builder(136)
 
     if service_id is not None:
         service_id_offset = builder.CreateString(service_id)
@@ -33,9 +36,7 @@ def serialise_ep00(
     builder.Finish(end)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER)
 
 
 EpicsConnection = namedtuple(
@@ -43,8 +44,11 @@ EpicsConnection = namedtuple(
 )
 
 
-def deserialise_ep00(buffer: Union[bytearray, bytes]) -> EpicsConnection:
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+def deserialise_ep00(
+    buffer: Union[bytearray, bytes], check_identifier: bool = True
+) -> EpicsConnection:
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     epics_connection = EpicsConnectionInfo.EpicsConnectionInfo.GetRootAsEpicsConnectionInfo(
         buffer, 0
@@ -0,0 +1,144 @@
+from typing import Optional, Union
+import numpy as np
+from streaming_data_types.eventdata_ev42 import (
+    EventData,
+    EventDataView,
+    serialise_ev42,
+)
+
+
+class EventFilter:
+    """
+    Selects the ev42 events in a time of flight window, from a set of detectors and
+    in a pulse time range.
+
+    Events are selected with vectorised masks over the arrays read straight from the
+    buffer, and detector ids are looked up in a precomputed boolean table rather than
+    searched for, unless the ids are too large for one. Messages outside the pulse time range are rejected before their
+    events are decoded. All limits include the minimum but not the maximum.
+    """
+
+    def __init__(
+        self,
+        tof_min: Optional[int] = None,
+        tof_max: Optional[int] = None,
+        detector_ids=None,
+        pulse_time_min: Optional[int] = None,
+        pulse_time_max: Optional[int] = None,
+        max_dense_size: int = 1 << 24,
+    ):
+        """
+        :param tof_min: the smallest time of flight to keep
+        :param tof_max: times of flight from this value up are dropped
+        :param detector_ids: the detector ids to keep, by default all are kept
+        :param pulse_time_min: the earliest pulse time to keep
+        :param pulse_time_max: messages from this pulse time on are dropped
+        :param max_dense_size: the largest detector id lookup table to use, larger
+            ids are searched for in the sorted ids instead
+        """
+        self.tof_min = tof_min
+        self.tof_max = tof_max
+        self.pulse_time_min = pulse_time_min
+        self.pulse_time_max = pulse_time_max
+        self._detector_table = None
+        self._sorted_detector_ids = None
+        if detector_ids is not None:
+            detector_ids = np.asarray(detector_ids, dtype=np.int64)
+            if detector_ids.size and detector_ids.min() < 0:
+                raise ValueError("Detector ids must not be negative")
+            # The last entry is always False and is used for all ids above the
+            # largest selected one, and for negative ids
+            size = detector_ids.max() + 2 if detector_ids.size else 1
+            if size <= max_dense_size:
+                self._detector_table = np.zeros(size, dtype=bool)
+                self._detector_table[detector_ids] = True
+            else:
+                self._sorted_detector_ids = np.unique(detector_ids)
+
+    def accepts_pulse_time(self, pulse_time: int) -> bool:
+        """
+        :param pulse_time: a message's pulse time
+        :return: whether the pulse time is in the selected range
+        """
+        if self.pulse_time_min is not None and pulse_time < self.pulse_time_min:
+            return False
+        if self.pulse_time_max is not None and pulse_time >= self.pulse_time_max:
+            return False
+        return True
+
+    def mask(self, time_of_flight, detector_id) -> np.ndarray:
+        """
+        Get which events are selected.
+
+        :param time_of_flight: the events' times of flight
+        :param detector_id: the events' detector ids
+        :return: a boolean array that is True for the selected events
+        """
+        time_of_flight = np.asarray(time_of_flight)
+        detector_id = np.asarray(detector_id)
+        if self._detector_table is not None:
+            last_entry = len(self._detector_table) - 1
+            # Negative ids are clipped to -1, which also indexes the last entry
+            mask = self._detector_table[
+                np.clip(detector_id, -1, last_entry, dtype=np.int64)
+            ]
+        elif self._sorted_detector_ids is not None:
+            detector_id = detector_id.astype(np.int64, copy=False)
+            index = np.searchsorted(self._sorted_detector_ids, detector_id)
+            np.minimum(index, len(self._sorted_detector_ids) - 1, out=index)
+            mask = self._sorted_detector_ids[index] == detector_id
+        else:
+            mask = np.ones(len(detector_id), dtype=bool)
+        if self.tof_min is not None:
+            mask &= time_of_flight >= self.tof_min
+        if self.tof_max is not None:
+            mask &= time_of_flight < self.tof_max
+        return mask
+
+    def filter_event_data(self, event_data) -> Optional[EventData]:
+        """
+        Select the events of a deserialised ev42 message.
+
+        :param event_data: an EventData or EventDataView
+        :return: an EventData of the selected events, or None if the message is
+            outside the pulse time range
+        """
+        if not self.accepts_pulse_time(event_data.pulse_time):
+            return None
+        time_of_flight = event_data.time_of_flight
+        detector_id = event_data.detector_id
+        mask = self.mask(time_of_flight, detector_id)
+        return EventData(
+            event_data.source_name,
+            event_data.message_id,
+            event_data.pulse_time,
+            time_of_flight[mask],
+            detector_id[mask],
+            event_data.specific_data,
+        )
+
+    def filter_ev42(
+        self, buffer: Union[bytes, bytearray, memoryview], out=None, copy=True
+    ) -> Optional[Union[bytes, memoryview]]:
+        """
+        Select the events of an ev42 message and serialise them as a new ev42 message.
+
+        :param buffer: the ev42 FlatBuffers buffer
+        :param out: optional writable buffer to write the message into
+        :param copy: if False, return a memoryview over the builder's memory
+        :return: the filtered ev42 message, or None if the message is outside the
+            pulse time range
+        """
+        filtered = self.filter_event_data(EventDataView(buffer))
+        if filtered is None:
+            return None
+        return serialise_ev42(
+            filtered.source_name,
+            filtered.message_id,
+            filtered.pulse_time,
+            filtered.time_of_flight,
+            filtered.detector_id,
+            filtered.specific_data,
+            out,
+            copy,
+        )
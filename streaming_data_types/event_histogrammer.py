@@ -0,0 +1,206 @@
+import time
+from typing import Optional, Union
+import numpy as np
+from streaming_data_types.detector_mapping import DetectorMapping
+from streaming_data_types.eventdata_ev42 import EventDataView
+from streaming_data_types.histogram_hs00 import serialise_hs00
+
+
+class _Binning:
+    """
+    Maps values to bin indices for a set of bin edges, with -1 for values outside.
+    """
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1 or len(self.edges) < 2:
+            raise ValueError("Bin edges must be a 1D array of at least two values")
+        widths = np.diff(self.edges)
+        if np.any(widths <= 0):
+            raise ValueError("Bin edges must be strictly increasing")
+        self.size = len(self.edges) - 1
+        # Equal width bins can be calculated directly rather than searched for. The
+        # calculated bin is corrected by at most one, so this is only done if every
+        # edge is well within a bin width of where equal width bins would put it
+        width = (self.edges[-1] - self.edges[0]) / self.size
+        equal_width_edges = self.edges[0] + np.arange(self.size + 1) * width
+        deviation = np.max(np.abs(self.edges - equal_width_edges))
+        self._width = width if deviation <= width / 4 else None
+
+    def indices(self, values: np.ndarray) -> np.ndarray:
+        # Bins include their lower edge but not their upper edge
+        if self._width is not None:
+            bins = np.floor((values - self.edges[0]) / self._width).astype(np.int64)
+            np.clip(bins, 0, self.size - 1, out=bins)
+            # Correct values that rounding put next to the bin they belong in
+            bins -= values < self.edges[bins]
+            bins += values >= self.edges[bins + 1]
+        else:
+            bins = np.searchsorted(self.edges, values, side="right") - 1
+        bins[(values < self.edges[0]) | (values >= self.edges[-1])] = -1
+        return bins
+
+
+class EventHistogrammer:
+    """
+    Accumulates ev42 events into a time of flight by detector id histogram.
+
+    Counts are kept in a preallocated array and each batch of events is binned with
+    vectorised NumPy operations. The histogram can be output as an hs00 dictionary or
+    message at any time; publish additionally limits how often messages are produced.
+    """
+
+    def __init__(
+        self,
+        tof_edges,
+        detector_edges,
+        source: str = "",
+        publish_interval_s: float = 0.0,
+        counts: Optional[np.ndarray] = None,
+        detector_mapping: Optional[DetectorMapping] = None,
+    ):
+        """
+        :param tof_edges: bin edges for time of flight
+        :param detector_edges: bin edges for detector id, e.g. use
+            np.arange(first_id, last_id + 2) for one bin per detector
+        :param source: the source name used in the hs00 message
+        :param publish_interval_s: the minimum time between published messages
+        :param counts: optional zeroed uint64 array to accumulate into, e.g. one in
+            shared memory, by default a new array is allocated
+        :param detector_mapping: optional mapping applied to the detector ids before
+            they are binned, e.g. to histogram by spectrum number
+        """
+        self._tof_binning = _Binning(tof_edges)
+        self._detector_binning = _Binning(detector_edges)
+        self.source = source
+        self.publish_interval_s = publish_interval_s
+        self.detector_mapping = detector_mapping
+        shape = (self._tof_binning.size, self._detector_binning.size)
+        if counts is None:
+            counts = np.zeros(shape, dtype=np.uint64)
+        elif counts.shape != shape or counts.dtype != np.uint64:
+            raise ValueError(f"Counts must be a uint64 array with shape {shape}")
+        self._counts = counts
+        self._last_pulse_time = 0
+        self._last_publish_time = None
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        The accumulated counts, with shape (number of tof bins, number of detector bins)
+        """
+        return self._counts
+
+    @property
+    def last_pulse_time(self) -> int:
+        """
+        The pulse time of the most recently added ev42 message
+        """
+        return self._last_pulse_time
+
+    @last_pulse_time.setter
+    def last_pulse_time(self, pulse_time: int):
+        # For when the events are added elsewhere, e.g. in another process
+        self._last_pulse_time = pulse_time
+
+    def add_events(self, time_of_flight, detector_id):
+        """
+        Add events to the histogram, events outside the bin edges are ignored.
+
+        :param time_of_flight: the events' times of flight
+        :param detector_id: the events' detector ids
+        """
+        if self.detector_mapping is not None:
+            detector_id = self.detector_mapping.map(detector_id)
+        tof_bins = self._tof_binning.indices(np.asarray(time_of_flight))
+        detector_bins = self._detector_binning.indices(np.asarray(detector_id))
+        in_range = (tof_bins >= 0) & (detector_bins >= 0)
+        flat_bins = (
+            tof_bins[in_range] * self._detector_binning.size + detector_bins[in_range]
+        )
+        counts = self._counts.reshape(-1)
+        if flat_bins.size * 4 >= counts.size:
+            counts += np.bincount(flat_bins, minlength=counts.size).astype(np.uint64)
+        else:
+            # For few events relative to the number of bins, avoid allocating a
+            # temporary array the size of the whole histogram
+            bins, bin_counts = np.unique(flat_bins, return_counts=True)
+            counts[bins] += bin_counts.astype(np.uint64)
+
+    def add_event_data(self, event_data):
+        """
+        Add the events of a deserialised ev42 message.
+
+        :param event_data: an EventData or EventDataView
+        """
+        self.add_events(event_data.time_of_flight, event_data.detector_id)
+        self._last_pulse_time = event_data.pulse_time
+
+    def add_ev42(self, buffer: Union[bytes, bytearray, memoryview]):
+        """
+        Add the events of an ev42 message.
+
+        :param buffer: the ev42 FlatBuffers buffer
+        """
+        self.add_event_data(EventDataView(buffer))
+
+    def reset(self):
+        """
+        Set all counts to zero.
+        """
+        self._counts.fill(0)
+
+    def to_hs00_dict(self, timestamp: Optional[int] = None) -> dict:
+        """
+        Get the histogram as a dictionary as used by serialise_hs00.
+
+        :param timestamp: the histogram timestamp, defaults to the last pulse time
+        :return: the histogram dictionary
+        """
+        return {
+            "source": self.source,
+            "timestamp": self._last_pulse_time if timestamp is None else timestamp,
+            "current_shape": list(self._counts.shape),
+            "dim_metadata": [
+                {
+                    "length": self._tof_binning.size,
+                    "label": "time_of_flight",
+                    "bin_boundaries": self._tof_binning.edges,
+                },
+                {
+                    "length": self._detector_binning.size,
+                    "label": "detector_id",
+                    "bin_boundaries": self._detector_binning.edges,
+                },
+            ],
+            "data": self._counts,
+        }
+
+    def serialise(self, timestamp: Optional[int] = None) -> bytes:
+        """
+        Serialise the histogram as an hs00 FlatBuffers message.
+
+        :param timestamp: the histogram timestamp, defaults to the last pulse time
+        :return: the hs00 message
+        """
+        return serialise_hs00(self.to_hs00_dict(timestamp))
+
+    def publish(
+        self, timestamp: Optional[int] = None, now: Optional[float] = None
+    ) -> Optional[bytes]:
+        """
+        Serialise the histogram if at least publish_interval_s has passed since the
+        histogram was last published.
+
+        :param timestamp: the histogram timestamp, defaults to the last pulse time
+        :param now: the current time in seconds, defaults to the monotonic clock
+        :return: the hs00 message, or None if it is too soon to publish
+        """
+        now = time.monotonic() if now is None else now
+        if (
+            self._last_publish_time is not None
+            and now - self._last_publish_time < self.publish_interval_s
+        ):
+            return None
+        self._last_publish_time = now
+        return self.serialise(timestamp)
@@ -1,13 +1,23 @@
 from collections import namedtuple
-import flatbuffers
+import struct
+import numpy as np
 import streaming_data_types.fbschemas.eventdata_ev42.EventMessage as EventMessage
 import streaming_data_types.fbschemas.eventdata_ev42.FacilityData as FacilityData
 import streaming_data_types.fbschemas.isis_event_info_is84.ISISData as ISISData
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+    serialise_numpy_vector,
+)
 
 
 FILE_IDENTIFIER = b"ev42"
 
+# Upper bound for everything except the strings and vectors: the root offset, the
+# file identifier, the event and ISIS tables, their vtables and alignment padding
+_TABLE_SIZE_BOUND = 256
+
 
 EventData = namedtuple(
     "EventData",
@@ -22,40 +32,265 @@ EventData = namedtuple(
 )
 
 
-def deserialise_ev42(buffer):
+def _deserialise_specific_data(event):
+    if event.FacilitySpecificDataType() != FacilityData.FacilityData.ISISData:
+        return None
+    specific = event.FacilitySpecificData()
+    isis_buf = ISISData.ISISData()
+    isis_buf.Init(specific.Bytes, specific.Pos)
+    return {
+        "period_number": isis_buf.PeriodNumber(),
+        "run_state": isis_buf.RunState(),
+        "proton_charge": isis_buf.ProtonCharge(),
+    }
+
+
+def deserialise_ev42(buffer, check_identifier=True):
     """
     Deserialise FlatBuffer ev42.
 
     :param buffer: The FlatBuffers buffer.
+    :param check_identifier: Whether to check the buffer's schema identifier.
     :return: The deserialised data.
     """
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     event = EventMessage.EventMessage.GetRootAsEventMessage(buffer, 0)
 
-    specific_data = None
-    if event.FacilitySpecificDataType() == FacilityData.FacilityData.ISISData:
-        specific = event.FacilitySpecificData()
-        isis_buf = ISISData.ISISData()
-        isis_buf.Init(specific.Bytes, specific.Pos)
-        specific_data = {
-            "period_number": isis_buf.PeriodNumber(),
-            "run_state": isis_buf.RunState(),
-            "proton_charge": isis_buf.ProtonCharge(),
-        }
-
     return EventData(
         event.SourceName().decode("utf-8"),
         event.MessageId(),
         event.PulseTime(),
         event.TimeOfFlightAsNumpy(),
         event.DetectorIdAsNumpy(),
-        specific_data,
+        _deserialise_specific_data(event),
+    )
+
+
+_NOT_DECODED = object()
+
+
+class EventDataView:
+    """
+    Lazily deserialised FlatBuffer ev42.
+
+    Has the same attributes as EventData, but each one is only decoded from the
+    buffer when it is first accessed and is then cached. This is much cheaper than
+    deserialise_ev42 when only some of the fields are needed, e.g. the pulse time
+    and message id. The buffer must not be modified while the view is in use.
+    """
+
+    __slots__ = (
+        "_event",
+        "_source_name",
+        "_message_id",
+        "_pulse_time",
+        "_time_of_flight",
+        "_detector_id",
+        "_specific_data",
+    )
+
+    def __init__(self, buffer, check_identifier=True):
+        """
+        :param buffer: The FlatBuffers buffer.
+        :param check_identifier: Whether to check the buffer's schema identifier.
+        """
+        if check_identifier:
+            check_schema_identifier(buffer, FILE_IDENTIFIER)
+
+        self._event = EventMessage.EventMessage.GetRootAsEventMessage(buffer, 0)
+        self._source_name = _NOT_DECODED
+        self._message_id = _NOT_DECODED
+        self._pulse_time = _NOT_DECODED
+        self._time_of_flight = _NOT_DECODED
+        self._detector_id = _NOT_DECODED
+        self._specific_data = _NOT_DECODED
+
+    @property
+    def source_name(self):
+        if self._source_name is _NOT_DECODED:
+            self._source_name = self._event.SourceName().decode("utf-8")
+        return self._source_name
+
+    @property
+    def message_id(self):
+        if self._message_id is _NOT_DECODED:
+            self._message_id = self._event.MessageId()
+        return self._message_id
+
+    @property
+    def pulse_time(self):
+        if self._pulse_time is _NOT_DECODED:
+            self._pulse_time = self._event.PulseTime()
+        return self._pulse_time
+
+    @property
+    def time_of_flight(self):
+        if self._time_of_flight is _NOT_DECODED:
+            self._time_of_flight = self._event.TimeOfFlightAsNumpy()
+        return self._time_of_flight
+
+    @property
+    def detector_id(self):
+        if self._detector_id is _NOT_DECODED:
+            self._detector_id = self._event.DetectorIdAsNumpy()
+        return self._detector_id
+
+    @property
+    def specific_data(self):
+        if self._specific_data is _NOT_DECODED:
+            self._specific_data = _deserialise_specific_data(self._event)
+        return self._specific_data
+
+    def to_event_data(self) -> EventData:
+        """
+        :return: All the fields decoded into an EventData.
+        """
+        return EventData(*(getattr(self, field) for field in EventData._fields))
+
+    def __reduce__(self):
+        # Pickled and copied as a new view of a copy of the buffer, as the buffer may
+        # be a memoryview and the not-decoded marker is only valid in this process
+        return EventDataView, (bytes(self._event._tab.Bytes), False)
+
+
+_uoffset = struct.Struct("<I")
+_soffset = struct.Struct("<i")
+_voffset = struct.Struct("<H")
+_uint64 = struct.Struct("<Q")
+
+# vtable offsets of the EventMessage fields, in the order they are returned by
+# _read_event_fields
+_MESSAGE_ID_FIELD = 6
+_PULSE_TIME_FIELD = 8
+_TIME_OF_FLIGHT_FIELD = 10
+_DETECTOR_ID_FIELD = 12
+
+
+def _read_event_fields(buffer):
+    # Equivalent to the generated EventMessage accessors, but reading the vtable
+    # directly avoids most of their per-call overhead when decoding many messages.
+    # Returns the message id, pulse time and the positions of the time of flight and
+    # detector id vectors, or None for missing vectors.
+    table = _uoffset.unpack_from(buffer, 0)[0]
+    vtable = table - _soffset.unpack_from(buffer, table)[0]
+    vtable_size = _voffset.unpack_from(buffer, vtable)[0]
+
+    def field_position(field):
+        if field >= vtable_size:
+            return None
+        offset = _voffset.unpack_from(buffer, vtable + field)[0]
+        return table + offset if offset else None
+
+    def scalar(field):
+        position = field_position(field)
+        return _uint64.unpack_from(buffer, position)[0] if position else 0
+
+    def vector(field):
+        position = field_position(field)
+        return position + _uoffset.unpack_from(buffer, position)[0] if position else None
+
+    return (
+        scalar(_MESSAGE_ID_FIELD),
+        scalar(_PULSE_TIME_FIELD),
+        vector(_TIME_OF_FLIGHT_FIELD),
+        vector(_DETECTOR_ID_FIELD),
+    )
+
+
+def _vector_as_numpy(buffer, vector):
+    if vector is None:
+        return np.empty(0, dtype=np.uint32)
+    length = _uoffset.unpack_from(buffer, vector)[0]
+    return np.frombuffer(buffer, "<u4", length, vector + _uoffset.size)
+
+
+EventDataBatch = namedtuple(
+    "EventDataBatch",
+    (
+        "message_id",
+        "pulse_time",
+        "event_offsets",
+        "time_of_flight",
+        "detector_id",
+    ),
+)
+
+
+def deserialise_ev42_batch(buffers, check_identifier=True) -> EventDataBatch:
+    """
+    Deserialise many FlatBuffer ev42 messages into single arrays.
+
+    The events of all the messages are copied straight into one time of flight and
+    one detector id array, which avoids deserialising each message and then
+    concatenating the results. The events of message i are at
+    event_offsets[i]:event_offsets[i + 1].
+
+    :param buffers: The FlatBuffers buffers.
+    :param check_identifier: Whether to check the buffers' schema identifiers.
+    :return: The deserialised data.
+    """
+    message_id = []
+    pulse_time = []
+    time_of_flight_vectors = []
+    detector_id_vectors = []
+
+    # First pass collects zero-copy views of each message's vectors
+    for i, buffer in enumerate(buffers):
+        if check_identifier:
+            check_schema_identifier(buffer, FILE_IDENTIFIER)
+        fields = _read_event_fields(buffer)
+        message_id.append(fields[0])
+        pulse_time.append(fields[1])
+        time_of_flight_vectors.append(_vector_as_numpy(buffer, fields[2]))
+        detector_id_vectors.append(_vector_as_numpy(buffer, fields[3]))
+        if len(time_of_flight_vectors[-1]) != len(detector_id_vectors[-1]):
+            raise ValueError(
+                f"Message {i} has {len(time_of_flight_vectors[-1])} times of flight "
+                f"but {len(detector_id_vectors[-1])} detector ids"
+            )
+
+    event_offsets = np.zeros(len(time_of_flight_vectors) + 1, dtype=np.int64)
+    np.cumsum([len(vector) for vector in time_of_flight_vectors], out=event_offsets[1:])
+
+    # Then the events are copied directly into the preallocated output arrays
+    time_of_flight = np.empty(event_offsets[-1], dtype=np.uint32)
+    detector_id = np.empty(event_offsets[-1], dtype=np.uint32)
+    if time_of_flight_vectors:
+        np.concatenate(time_of_flight_vectors, out=time_of_flight)
+        np.concatenate(detector_id_vectors, out=detector_id)
+
+    return EventDataBatch(
+        np.array(message_id, dtype=np.uint64),
+        np.array(pulse_time, dtype=np.uint64),
+        event_offsets,
+        time_of_flight,
+        detector_id,
+    )
+
+
+def _estimate_message_size(source_name, time_of_flight, detector_id):
+    # Each string and vector has a 4 byte length prefix and up to 4 bytes of padding
+    # or null terminator, and a character encodes to at most 4 bytes of UTF-8
+    return (
+        _TABLE_SIZE_BOUND
+        + 4 * len(source_name)
+        + 4 * len(time_of_flight)
+        + 4 * len(detector_id)
+        + 3 * 8
     )
 
 
 def serialise_ev42(
-    source_name, message_id, pulse_time, time_of_flight, detector_id, isis_specific=None
+    source_name,
+    message_id,
+    pulse_time,
+    time_of_flight,
+    detector_id,
+    isis_specific=None,
+    out=None,
+    copy=True,
 ):
     """
     Serialise event data as an ev42 FlatBuffers message.
@@ -66,23 +301,18 @@ def serialise_ev42(
     :param time_of_flight:
     :param detector_id:
     :param isis_specific:
+    :param out: optional writable buffer to write the message into
+    :param copy: if False, return a memoryview over the builder's memory
     :return:
     """
-    builder = flatbuffers.Builder(1024)
+    builder = get_builder(
+        _estimate_message_size(source_name, time_of_flight, detector_id)
+    )
 
     source = builder.CreateString(source_name)
 
-    EventMessage.EventMessageStartTimeOfFlightVector(builder, len(time_of_flight))
-    # FlatBuffers builds arrays backwards
-    for x in reversed(time_of_flight):
-        builder.PrependInt32(x)
-    tof_data = builder.EndVector(len(time_of_flight))
-
-    EventMessage.EventMessageStartDetectorIdVector(builder, len(detector_id))
-    # FlatBuffers builds arrays backwards
-    for x in reversed(detector_id):
-        builder.PrependInt32(x)
-    det_data = builder.EndVector(len(detector_id))
+    tof_data = serialise_numpy_vector(builder, time_of_flight, np.uint32)
+    det_data = serialise_numpy_vector(builder, detector_id, np.uint32)
 
     isis_data = None
     if isis_specific:
@@ -111,6 +341,86 @@ def serialise_ev42(
     builder.Finish(data)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER, out, copy)
+
+
+# Allows for the alignment padding that can be added around the two event vectors
+_VECTOR_PADDING_BOUND = 16
+
+
+def split_ev42(buffer, max_bytes: int) -> list:
+    """
+    Split an ev42 message into messages of at most max_bytes each.
+
+    Every part keeps the source name, message id, pulse time and ISIS data of the
+    original message, and the events are serialised straight from slices of the
+    original arrays.
+
+    :param buffer: The FlatBuffers buffer.
+    :param max_bytes: The maximum size of each message in bytes.
+    :return: The messages, just the original buffer if it is already small enough.
+    """
+    if len(buffer) <= max_bytes:
+        return [buffer]
+
+    event = EventDataView(buffer)
+    empty_size = len(
+        serialise_ev42(
+            event.source_name,
+            event.message_id,
+            event.pulse_time,
+            [],
+            [],
+            event.specific_data,
+        )
+    )
+    # Each event is 4 bytes of time of flight and 4 bytes of detector id
+    events_per_message = (max_bytes - empty_size - _VECTOR_PADDING_BOUND) // 8
+    if events_per_message < 1:
+        raise ValueError(f"{max_bytes} bytes is too small for an ev42 message")
+
+    time_of_flight = event.time_of_flight
+    detector_id = event.detector_id
+    return [
+        serialise_ev42(
+            event.source_name,
+            event.message_id,
+            event.pulse_time,
+            time_of_flight[start : start + events_per_message],
+            detector_id[start : start + events_per_message],
+            event.specific_data,
+        )
+        for start in range(0, len(time_of_flight), events_per_message)
+    ]
+
+
+def merge_ev42(buffers) -> bytes:
+    """
+    Merge ev42 messages from the same source and pulse into one message.
+
+    The merged message has the message id and ISIS data of the first message.
+
+    :param buffers: The FlatBuffers buffers.
+    :return: The merged message.
+    """
+    if not buffers:
+        raise ValueError("At least one message is needed to merge")
+
+    batch = deserialise_ev42_batch(buffers)
+    first = EventDataView(buffers[0], check_identifier=False)
+    if np.any(batch.pulse_time != first.pulse_time):
+        raise ValueError("Only messages with the same pulse time can be merged")
+    source_names = {
+        EventDataView(buffer, check_identifier=False).source_name for buffer in buffers
+    }
+    if len(source_names) > 1:
+        raise ValueError("Only messages with the same source name can be merged")
+
+    return serialise_ev42(
+        first.source_name,
+        first.message_id,
+        first.pulse_time,
+        batch.time_of_flight,
+        batch.detector_id,
+        first.specific_data,
+    )
@@ -1,7 +1,11 @@
 from collections import namedtuple
 import flatbuffers
 from flatbuffers.packer import struct as flatbuffer_struct
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+)
 from streaming_data_types.fbschemas.forwarder_config_update_rf5k import (
     UpdateType,
     ConfigUpdate,
@@ -17,14 +21,18 @@ ConfigurationUpdate = namedtuple("ConfigurationUpdate", ("config_change", "strea
 StreamInfo = namedtuple("StreamInfo", ("channel", "schema", "topic", "protocol"),)
 
 
-def deserialise_rf5k(buffer: Union[bytearray, bytes]) -> ConfigurationUpdate:
+def deserialise_rf5k(
+    buffer: Union[bytearray, bytes], check_identifier: bool = True
+) -> ConfigurationUpdate:
     """
     Deserialise FlatBuffer rf5k.
 
     :param buffer: The FlatBuffers buffer.
+    :param check_identifier: Whether to check the buffer's schema identifier.
     :return: The deserialised data.
     """
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     config_message = ConfigUpdate.ConfigUpdate.GetRootAsConfigUpdate(buffer, 0)
 
@@ -75,7 +83,7 @@ def serialise_rf5k(config_change: UpdateType, streams: List[StreamInfo]) -> byte
     :param streams: channel, schema and output topic configurations
     :return:
     """
-    builder = flatbuffers.Builder(1024)
+    builder = get_builder(1024)
 
     if streams:
         # We have to use multiple loops/list comprehensions here because we cannot create strings after we have
@@ -107,6 +115,4 @@ def serialise_rf5k(config_change: UpdateType, streams: List[StreamInfo]) -> byte
     builder.Finish(data)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER)
@@ -1,6 +1,5 @@
 from functools import reduce
 import operator
-import flatbuffers
 import numpy
 import streaming_data_types.fbschemas.histogram_hs00.ArrayFloat as ArrayFloat
 import streaming_data_types.fbschemas.histogram_hs00.ArrayDouble as ArrayDouble
@@ -9,11 +8,21 @@ import streaming_data_types.fbschemas.histogram_hs00.ArrayULong as ArrayULong
 import streaming_data_types.fbschemas.histogram_hs00.DimensionMetaData as DimensionMetaData
 import streaming_data_types.fbschemas.histogram_hs00.EventHistogram as EventHistogram
 from streaming_data_types.fbschemas.histogram_hs00.Array import Array
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+    serialise_numpy_vector_table,
+)
 
 
 FILE_IDENTIFIER = b"hs00"
 
+# Upper bound for the root offset, file identifier, histogram table, vtable and
+# alignment padding, and for each dimension's metadata and array tables
+_TABLE_SIZE_BOUND = 256
+_DIMENSION_TABLE_SIZE_BOUND = 128
+
 
 _array_for_type = {
     Array.ArrayUInt: ArrayUInt.ArrayUInt(),
@@ -26,14 +35,16 @@ def _create_array_object_for_type(array_type):
     return _array_for_type.get(array_type, ArrayDouble.ArrayDouble())
 
 
-def deserialise_hs00(buffer):
+def deserialise_hs00(buffer, check_identifier=True):
     """
     Deserialise flatbuffer hs10 into a histogram.
 
     :param buffer:
+    :param check_identifier: Whether to check the buffer's schema identifier.
     :return: dict of histogram information
     """
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
     event_hist = EventHistogram.EventHistogram.GetRootAsEventHistogram(buffer, 0)
 
     dims = []
@@ -93,7 +104,7 @@ def _serialise_metadata(builder, length, edges, unit, label):
     unit_offset = builder.CreateString(unit)
     label_offset = builder.CreateString(label)
 
-    bins_offset, bin_type = _serialise_array(builder, len(edges), edges)
+    bins_offset, bin_type = _serialise_array(builder, edges)
 
     DimensionMetaData.DimensionMetaDataStart(builder)
     DimensionMetaData.DimensionMetaDataAddLength(builder, length)
@@ -104,7 +115,39 @@ def _serialise_metadata(builder, length, edges, unit, label):
     return DimensionMetaData.DimensionMetaDataEnd(builder)
 
 
-def serialise_hs00(histogram):
+def _estimate_string_size(string):
+    # Length prefix, null terminator and padding, and at most 4 bytes per character
+    return 4 * len(string) + 8
+
+
+def _estimate_array_size(data, length):
+    # Length prefix and padding, plus the element width _serialise_array will use,
+    # the widest for array-likes without a dtype
+    dtype = getattr(data, "dtype", None)
+    narrow = dtype is not None and (
+        numpy.issubdtype(dtype, numpy.uint32) or numpy.issubdtype(dtype, numpy.float32)
+    )
+    return (4 if narrow else 8) * length + 16
+
+
+def _estimate_message_size(histogram):
+    data_len = reduce(operator.mul, histogram["current_shape"], 1)
+    size = _TABLE_SIZE_BOUND + 4 * len(histogram["current_shape"]) + 8
+    size += _estimate_array_size(histogram["data"], data_len)
+    if "errors" in histogram:
+        size += _estimate_array_size(histogram["errors"], data_len)
+    size += _estimate_string_size(histogram.get("source", ""))
+    size += _estimate_string_size(histogram.get("info", ""))
+    for meta in histogram["dim_metadata"]:
+        size += _DIMENSION_TABLE_SIZE_BOUND + _estimate_array_size(
+            meta["bin_boundaries"], len(meta["bin_boundaries"])
+        )
+        size += _estimate_string_size(meta.get("unit", ""))
+        size += _estimate_string_size(meta.get("label", ""))
+    return size
+
+
+def serialise_hs00(histogram, out=None, copy=True):
     """
     Serialise a histogram as an hs00 FlatBuffers message.
 
@@ -112,11 +155,13 @@ def serialise_hs00(histogram):
     or np.float64 then type is preserved in output buffer.
 
     :param histogram: A dictionary containing the histogram to serialise.
+    :param out: Optional writable buffer to write the message into.
+    :param copy: If False, return a memoryview over the builder's memory.
     """
     source_offset = None
     info_offset = None
 
-    builder = flatbuffers.Builder(1024)
+    builder = get_builder(_estimate_message_size(histogram))
     if "source" in histogram:
         source_offset = builder.CreateString(histogram["source"])
     if "info" in histogram:
@@ -148,14 +193,11 @@ def serialise_hs00(histogram):
     metadata_vector = builder.EndVector(rank)
 
     # Build the data
-    data_len = reduce(operator.mul, histogram["current_shape"], 1)
-    data_offset, data_type = _serialise_array(builder, data_len, histogram["data"])
+    data_offset, data_type = _serialise_array(builder, histogram["data"])
 
     errors_offset = None
     if "errors" in histogram:
-        errors_offset, error_type = _serialise_array(
-            builder, data_len, histogram["errors"]
-        )
+        errors_offset, error_type = _serialise_array(builder, histogram["errors"])
 
     # Build the actual buffer
     EventHistogram.EventHistogramStart(builder)
@@ -179,78 +221,77 @@ def serialise_hs00(histogram):
     builder.Finish(hist_message)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER, out, copy)
 
 
-def _serialise_array(builder, data_len, data):
-    flattened_data = numpy.asarray(data).flatten()
+def _serialise_array(builder, data):
+    # The array is flattened as it is copied into the builder
+    flattened_data = numpy.asarray(data)
 
     # Carefully preserve explicitly supported types
     if numpy.issubdtype(flattened_data.dtype, numpy.uint32):
-        return _serialise_uint32(builder, data_len, flattened_data)
+        return _serialise_uint32(builder, flattened_data)
     if numpy.issubdtype(flattened_data.dtype, numpy.uint64):
-        return _serialise_uint64(builder, data_len, flattened_data)
+        return _serialise_uint64(builder, flattened_data)
     if numpy.issubdtype(flattened_data.dtype, numpy.float32):
-        return _serialise_float(builder, data_len, flattened_data)
+        return _serialise_float(builder, flattened_data)
     if numpy.issubdtype(flattened_data.dtype, numpy.float64):
-        return _serialise_double(builder, data_len, flattened_data)
+        return _serialise_double(builder, flattened_data)
 
     # Otherwise if it looks like an int then use uint64, or use double as last resort
     if numpy.issubdtype(flattened_data.dtype, numpy.int64):
-        return _serialise_uint64(builder, data_len, flattened_data)
+        return _serialise_uint64(builder, flattened_data)
 
-    return _serialise_double(builder, data_len, flattened_data)
+    return _serialise_double(builder, flattened_data)
 
 
-def _serialise_float(builder, data_len, flattened_data):
+def _serialise_float(builder, flattened_data):
     data_type = Array.ArrayFloat
-    ArrayFloat.ArrayFloatStartValueVector(builder, data_len)
-    # FlatBuffers builds arrays backwards
-    for x in reversed(flattened_data):
-        builder.PrependFloat32(x)
-    data_vector = builder.EndVector(data_len)
-    ArrayFloat.ArrayFloatStart(builder)
-    ArrayFloat.ArrayFloatAddValue(builder, data_vector)
-    data_offset = ArrayFloat.ArrayFloatEnd(builder)
+    data_offset = serialise_numpy_vector_table(
+        builder,
+        flattened_data,
+        numpy.float32,
+        ArrayFloat.ArrayFloatStart,
+        ArrayFloat.ArrayFloatAddValue,
+        ArrayFloat.ArrayFloatEnd,
+    )
     return data_offset, data_type
 
 
-def _serialise_double(builder, data_len, flattened_data):
+def _serialise_double(builder, flattened_data):
     data_type = Array.ArrayDouble
-    ArrayDouble.ArrayDoubleStartValueVector(builder, data_len)
-    # FlatBuffers builds arrays backwards
-    for x in reversed(flattened_data):
-        builder.PrependFloat64(x)
-    data_vector = builder.EndVector(data_len)
-    ArrayDouble.ArrayDoubleStart(builder)
-    ArrayDouble.ArrayDoubleAddValue(builder, data_vector)
-    data_offset = ArrayDouble.ArrayDoubleEnd(builder)
+    data_offset = serialise_numpy_vector_table(
+        builder,
+        flattened_data,
+        numpy.float64,
+        ArrayDouble.ArrayDoubleStart,
+        ArrayDouble.ArrayDoubleAddValue,
+        ArrayDouble.ArrayDoubleEnd,
+    )
     return data_offset, data_type
 
 
-def _serialise_uint32(builder, data_len, flattened_data):
+def _serialise_uint32(builder, flattened_data):
     data_type = Array.ArrayUInt
-    ArrayUInt.ArrayUIntStartValueVector(builder, data_len)
-    # FlatBuffers builds arrays backwards
-    for x in reversed(flattened_data):
-        builder.PrependUint32(x)
-    data_vector = builder.EndVector(data_len)
-    ArrayUInt.ArrayUIntStart(builder)
-    ArrayUInt.ArrayUIntAddValue(builder, data_vector)
-    data_offset = ArrayUInt.ArrayUIntEnd(builder)
+    data_offset = serialise_numpy_vector_table(
+        builder,
+        flattened_data,
+        numpy.uint32,
+        ArrayUInt.ArrayUIntStart,
+        ArrayUInt.ArrayUIntAddValue,
+        ArrayUInt.ArrayUIntEnd,
+    )
     return data_offset, data_type
 
 
-def _serialise_uint64(builder, data_len, flattened_data):
+def _serialise_uint64(builder, flattened_data):
     data_type = Array.ArrayULong
-    ArrayULong.ArrayULongStartValueVector(builder, data_len)
-    # FlatBuffers builds arrays backwards
-    for x in reversed(flattened_data):
-        builder.PrependUint64(x)
-    data_vector = builder.EndVector(data_len)
-    ArrayULong.ArrayULongStart(builder)
-    ArrayULong.ArrayULongAddValue(builder, data_vector)
-    data_offset = ArrayULong.ArrayULongEnd(builder)
+    data_offset = serialise_numpy_vector_table(
+        builder,
+        flattened_data,
+        numpy.uint64,
+        ArrayULong.ArrayULongStart,
+        ArrayULong.ArrayULongAddValue,
+        ArrayULong.ArrayULongEnd,
+    )
     return data_offset, data_type
@@ -0,0 +1,184 @@
+from typing import Any, Optional, Union
+import numpy as np
+from streaming_data_types.logdata_f142 import serialise_f142
+
+
+class F142Filter:
+    """
+    Drops f142 updates that are within a deadband of the last value sent for their
+    source, or that come too soon after it.
+
+    An update passes the deadband if any element differs from the last value sent by
+    more than the absolute deadband or the relative deadband times the last value's
+    magnitude, so array values are compared with one vectorised operation. The first
+    update of a source, a change of alarm, shape or type, and non-finite or
+    non-numeric values that differ always pass the deadband. The rate limit applies
+    to all updates and is based on their timestamps.
+
+    Per-source state is kept in arrays indexed by source, which grow as sources are
+    added, along with counts of the updates each check dropped.
+    """
+
+    def __init__(
+        self,
+        absolute_deadband: float = 0.0,
+        relative_deadband: float = 0.0,
+        max_rate_hz: Optional[float] = None,
+    ):
+        """
+        :param absolute_deadband: changes up to this size are dropped
+        :param relative_deadband: changes up to this fraction of the last value sent
+            are dropped
+        :param max_rate_hz: optional maximum number of updates per second per source
+        """
+        self.absolute_deadband = absolute_deadband
+        self.relative_deadband = relative_deadband
+        self._min_interval_ns = (
+            0 if max_rate_hz is None else int(round(1e9 / max_rate_hz))
+        )
+        self._source_index = {}
+        self._last_values = []
+        self._last_timestamp = np.zeros(0, dtype=np.uint64)
+        self._last_alarm = np.zeros((0, 2), dtype=np.int64)
+        self._passed = np.zeros(0, dtype=np.uint64)
+        self._dropped_by_deadband = np.zeros(0, dtype=np.uint64)
+        self._dropped_by_rate = np.zeros(0, dtype=np.uint64)
+
+    def _index_for(self, source_name: str) -> int:
+        index = self._source_index.get(source_name)
+        if index is not None:
+            return index
+        index = len(self._source_index)
+        self._source_index[source_name] = index
+        self._last_values.append(None)
+        if index == len(self._last_timestamp):
+            # Grow the state arrays by doubling so adding sources is amortised O(1)
+            size = max(2 * index, 16)
+            self._last_timestamp = np.resize(self._last_timestamp, size)
+            self._last_alarm = np.resize(self._last_alarm, (size, 2))
+            self._passed = np.resize(self._passed, size)
+            self._dropped_by_deadband = np.resize(self._dropped_by_deadband, size)
+            self._dropped_by_rate = np.resize(self._dropped_by_rate, size)
+        self._passed[index] = 0
+        self._dropped_by_deadband[index] = 0
+        self._dropped_by_rate[index] = 0
+        return index
+
+    def _outside_deadband(self, value: np.ndarray, last_value: np.ndarray) -> bool:
+        if value.shape != last_value.shape or value.dtype != last_value.dtype:
+            return True
+        if value.dtype.kind not in "iuf":
+            return not np.array_equal(value, last_value)
+        last_value = last_value.astype(np.float64)
+        threshold = np.maximum(
+            self.absolute_deadband, self.relative_deadband * np.abs(last_value)
+        )
+        # A change to, from or between non-finite values passes if the values differ,
+        # with NaNs equal to each other, as the difference can't be compared
+        finite = np.isfinite(value) & np.isfinite(last_value)
+        both_nan = np.isnan(value) & np.isnan(last_value)
+        with np.errstate(invalid="ignore"):
+            changed = np.where(
+                finite,
+                np.abs(value - last_value) > threshold,
+                (value != last_value) & ~both_nan,
+            )
+        return bool(np.any(changed))
+
+    def accept(
+        self,
+        source_name: str,
+        value: Any,
+        timestamp_unix_ns: int,
+        alarm_status: Union[int, None] = None,
+        alarm_severity: Union[int, None] = None,
+    ) -> bool:
+        """
+        Check whether an update should be sent, and if so record it as the last value
+        sent for its source.
+
+        :param source_name: name of the data source
+        :param value: the scalar or 1D array value
+        :param timestamp_unix_ns: timestamp of the value in nanoseconds
+        :param alarm_status: EPICS alarm status
+        :param alarm_severity: EPICS alarm severity
+        :return: whether the update passed the filter
+        """
+        index = self._index_for(source_name)
+        value = np.asarray(value)
+        last_value = self._last_values[index]
+        alarm = (
+            -1 if alarm_status is None else alarm_status,
+            -1 if alarm_severity is None else alarm_severity,
+        )
+
+        if last_value is not None:
+            if (
+                self._min_interval_ns
+                and timestamp_unix_ns - int(self._last_timestamp[index])
+                < self._min_interval_ns
+            ):
+                self._dropped_by_rate[index] += 1
+                return False
+            if tuple(self._last_alarm[index]) == alarm and not (
+                self._outside_deadband(value, last_value)
+            ):
+                self._dropped_by_deadband[index] += 1
+                return False
+
+        # Copied, as the caller may modify an array after it is sent
+        self._last_values[index] = value.copy()
+        self._last_timestamp[index] = timestamp_unix_ns
+        self._last_alarm[index] = alarm
+        self._passed[index] += 1
+        return True
+
+    def serialise(
+        self,
+        value: Any,
+        source_name: str,
+        timestamp_unix_ns: int = 0,
+        alarm_status: Union[int, None] = None,
+        alarm_severity: Union[int, None] = None,
+    ) -> Optional[bytes]:
+        """
+        Serialise an update with serialise_f142 if it passes the filter.
+
+        :param value: the scalar or 1D array value
+        :param source_name: name of the data source
+        :param timestamp_unix_ns: timestamp of the value in nanoseconds
+        :param alarm_status: EPICS alarm status
+        :param alarm_severity: EPICS alarm severity
+        :return: the f142 message, or None if the update was dropped
+        """
+        if not self.accept(
+            source_name, value, timestamp_unix_ns, alarm_status, alarm_severity
+        ):
+            return None
+        return serialise_f142(
+            value, source_name, timestamp_unix_ns, alarm_status, alarm_severity
+        )
+
+    def counts(self, source_name: str) -> dict:
+        """
+        :param source_name: name of the data source
+        :return: the number of updates of the source passed and dropped by each check
+        """
+        index = self._source_index.get(source_name)
+        if index is None:
+            return {"passed": 0, "dropped_by_deadband": 0, "dropped_by_rate": 0}
+        return {
+            "passed": int(self._passed[index]),
+            "dropped_by_deadband": int(self._dropped_by_deadband[index]),
+            "dropped_by_rate": int(self._dropped_by_rate[index]),
+        }
+
+    @property
+    def dropped(self) -> int:
+        """
+        The total number of updates dropped for all sources
+        """
+        size = len(self._source_index)
+        return int(
+            self._dropped_by_deadband[:size].sum() + self._dropped_by_rate[:size].sum()
+        )
@@ -0,0 +1,248 @@
+from collections import OrderedDict, namedtuple
+from typing import Any, Iterable, Optional
+import numpy as np
+from streaming_data_types.logdata_f142 import deserialise_f142, deserialise_f142_batch
+
+TimeSeries = namedtuple("TimeSeries", ("timestamp_unix_ns", "value"))
+
+
+class _RingBuffer:
+    """
+    Fixed capacity history of timestamped values, the oldest are overwritten.
+    """
+
+    def __init__(self, capacity: int, value_dtype):
+        self.timestamps = np.zeros(capacity, dtype=np.uint64)
+        self.values = np.zeros(capacity, dtype=value_dtype)
+        self.start = 0
+        self.size = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + self.values.nbytes
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if not self.size:
+            return None
+        return int(self.timestamps[(self.start + self.size - 1) % len(self.timestamps)])
+
+    def append(self, timestamp: int, value):
+        capacity = len(self.timestamps)
+        index = (self.start + self.size) % capacity
+        self.timestamps[index] = timestamp
+        self.values[index] = value
+        if self.size < capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % capacity
+
+    def _segments(self):
+        # The stored entries as at most two contiguous slices, oldest first
+        end = self.start + self.size
+        capacity = len(self.timestamps)
+        return (
+            slice(self.start, min(end, capacity)),
+            slice(0, max(end - capacity, 0)),
+        )
+
+    def _count_before(self, timestamp: int) -> int:
+        return sum(
+            int(np.searchsorted(self.timestamps[segment], timestamp, side="left"))
+            for segment in self._segments()
+        )
+
+    def evict_before(self, timestamp: int):
+        evicted = self._count_before(timestamp)
+        self.start = (self.start + evicted) % len(self.timestamps)
+        self.size -= evicted
+
+    def query(self, start: Optional[int], stop: Optional[int]) -> TimeSeries:
+        timestamps = []
+        values = []
+        for segment in self._segments():
+            segment_timestamps = self.timestamps[segment]
+            first = (
+                0
+                if start is None
+                else np.searchsorted(segment_timestamps, start, side="left")
+            )
+            last = (
+                len(segment_timestamps)
+                if stop is None
+                else np.searchsorted(segment_timestamps, stop, side="left")
+            )
+            timestamps.append(segment_timestamps[first:last])
+            values.append(self.values[segment][first:last])
+        return TimeSeries(np.concatenate(timestamps), np.concatenate(values))
+
+
+class LogDataStore:
+    """
+    In-memory history of f142 values, with one fixed capacity ring buffer per source.
+
+    Appending and getting the last value are O(1), and time range queries use a
+    binary search of the timestamps. The memory used is bounded: each source's
+    history is limited to capacity entries, entries older than max_age_ns before a
+    source's newest entry are evicted, and if adding a source would exceed the
+    memory budget the least recently updated sources are evicted.
+
+    Timestamps must not decrease within a source; older updates are counted in
+    dropped and otherwise ignored.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        max_age_ns: Optional[int] = None,
+        memory_budget_bytes: Optional[int] = None,
+        value_dtype: Any = np.float64,
+    ):
+        """
+        :param capacity: the maximum number of values kept per source
+        :param max_age_ns: optional age after which values are evicted
+        :param memory_budget_bytes: optional limit on the memory used by the histories
+        :param value_dtype: the type values are stored as, all must be numeric scalars
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        self.capacity = capacity
+        self.max_age_ns = max_age_ns
+        self.memory_budget_bytes = memory_budget_bytes
+        self.value_dtype = np.dtype(value_dtype)
+        self.dropped = 0
+        # Ordered from least to most recently updated
+        self._buffers = OrderedDict()
+        self._buffer_nbytes = capacity * (8 + self.value_dtype.itemsize)
+        if (
+            memory_budget_bytes is not None
+            and memory_budget_bytes < self._buffer_nbytes
+        ):
+            raise ValueError(
+                f"Memory budget of {memory_budget_bytes} bytes is less than the "
+                f"{self._buffer_nbytes} bytes needed for one source"
+            )
+
+    @property
+    def sources(self) -> list:
+        """
+        The names of the sources with a history, least recently updated first
+        """
+        return list(self._buffers)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the histories in bytes
+        """
+        return len(self._buffers) * self._buffer_nbytes
+
+    def __contains__(self, source_name: str) -> bool:
+        return source_name in self._buffers
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def _buffer_for(self, source_name: str) -> _RingBuffer:
+        buffer = self._buffers.get(source_name)
+        if buffer is not None:
+            self._buffers.move_to_end(source_name)
+            return buffer
+        if self.memory_budget_bytes is not None:
+            while self.nbytes + self._buffer_nbytes > self.memory_budget_bytes:
+                self._buffers.popitem(last=False)
+        buffer = _RingBuffer(self.capacity, self.value_dtype)
+        self._buffers[source_name] = buffer
+        return buffer
+
+    def append(self, source_name: str, timestamp_unix_ns: int, value):
+        """
+        Add a value to a source's history.
+
+        :param source_name: name of the data source
+        :param timestamp_unix_ns: timestamp of the value in nanoseconds
+        :param value: the numeric scalar value
+        """
+        buffer = self._buffer_for(source_name)
+        last_timestamp = buffer.last_timestamp
+        if last_timestamp is not None and timestamp_unix_ns < last_timestamp:
+            self.dropped += 1
+            return
+        buffer.append(timestamp_unix_ns, value)
+        if self.max_age_ns is not None:
+            buffer.evict_before(max(timestamp_unix_ns - self.max_age_ns, 0))
+
+    def add_f142(self, buffer):
+        """
+        Add the value of a scalar f142 message.
+
+        :param buffer: the f142 FlatBuffers buffer
+        """
+        log_data = deserialise_f142(buffer)
+        value = np.asarray(log_data.value)
+        if value.ndim != 0 or value.dtype.kind not in "iuf":
+            raise ValueError("Only numeric scalar values can be stored")
+        self.append(log_data.source_name, log_data.timestamp_unix_ns, value)
+
+    def add_f142_batch(self, buffers: Iterable):
+        """
+        Add the values of many scalar f142 messages, decoded with
+        deserialise_f142_batch.
+
+        :param buffers: the f142 FlatBuffers buffers
+        """
+        batch = deserialise_f142_batch(buffers, value_dtype=self.value_dtype)
+        for source_index, timestamp, value in zip(
+            batch.source_index.tolist(),
+            batch.timestamp_unix_ns.tolist(),
+            batch.value.tolist(),
+        ):
+            self.append(batch.source_names[source_index], timestamp, value)
+
+    def last(self, source_name: str) -> Optional[TimeSeries]:
+        """
+        Get the latest value of a source.
+
+        :param source_name: name of the data source
+        :return: the timestamp and value, or None if the source has no values
+        """
+        buffer = self._buffers.get(source_name)
+        if buffer is None or not buffer.size:
+            return None
+        index = (buffer.start + buffer.size - 1) % self.capacity
+        return TimeSeries(int(buffer.timestamps[index]), buffer.values[index])
+
+    def query(
+        self,
+        source_name: str,
+        start_unix_ns: Optional[int] = None,
+        stop_unix_ns: Optional[int] = None,
+    ) -> TimeSeries:
+        """
+        Get the values of a source in a time range, oldest first.
+
+        :param source_name: name of the data source
+        :param start_unix_ns: the earliest timestamp to include, by default from the
+            oldest value
+        :param stop_unix_ns: values from this timestamp on are excluded, by default up
+            to the newest value
+        :return: arrays of the timestamps and values
+        """
+        buffer = self._buffers.get(source_name)
+        if buffer is None:
+            return TimeSeries(
+                np.empty(0, dtype=np.uint64), np.empty(0, dtype=self.value_dtype)
+            )
+        return buffer.query(start_unix_ns, stop_unix_ns)
+
+    def evict_before(self, timestamp_unix_ns: int):
+        """
+        Evict the values of all sources older than a timestamp, sources left without
+        values are removed.
+
+        :param timestamp_unix_ns: the earliest timestamp to keep
+        """
+        for source_name, buffer in list(self._buffers.items()):
+            buffer.evict_before(timestamp_unix_ns)
+            if not buffer.size:
+                del self._buffers[source_name]
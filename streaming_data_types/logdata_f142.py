@@ -12,7 +12,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayUByte import (
     ArrayUByteStart,
     ArrayUByteAddValue,
     ArrayUByteEnd,
-    ArrayUByteStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.Byte import (
     Byte,
@@ -25,7 +24,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayByte import (
     ArrayByteStart,
     ArrayByteAddValue,
     ArrayByteEnd,
-    ArrayByteStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.UShort import (
     UShort,
@@ -38,7 +36,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayUShort import (
     ArrayUShortStart,
     ArrayUShortAddValue,
     ArrayUShortEnd,
-    ArrayUShortStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.Short import (
     Short,
@@ -51,7 +48,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayShort import (
     ArrayShortStart,
     ArrayShortAddValue,
     ArrayShortEnd,
-    ArrayShortStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.UInt import (
     UInt,
@@ -64,7 +60,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayUInt import (
     ArrayUIntStart,
     ArrayUIntAddValue,
     ArrayUIntEnd,
-    ArrayUIntStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.Int import (
     Int,
@@ -77,7 +72,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayInt import (
     ArrayIntStart,
     ArrayIntAddValue,
     ArrayIntEnd,
-    ArrayIntStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.ULong import (
     ULong,
@@ -90,7 +84,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayULong import (
     ArrayULongStart,
     ArrayULongAddValue,
     ArrayULongEnd,
-    ArrayULongStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.Long import (
     Long,
@@ -103,7 +96,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayLong import (
     ArrayLongStart,
     ArrayLongAddValue,
     ArrayLongEnd,
-    ArrayLongStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.Float import (
     Float,
@@ -116,7 +108,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayFloat import (
     ArrayFloatStart,
     ArrayFloatAddValue,
     ArrayFloatEnd,
-    ArrayFloatStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.Double import (
     Double,
@@ -129,7 +120,6 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayDouble import (
     ArrayDoubleStart,
     ArrayDoubleAddValue,
     ArrayDoubleEnd,
-    ArrayDoubleStartValueVector,
 )
 from streaming_data_types.fbschemas.logdata_f142.String import (
     String,
@@ -144,11 +134,17 @@ from streaming_data_types.fbschemas.logdata_f142.ArrayString import (
     ArrayStringEnd,
     ArrayStringStartValueVector,
 )
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+    serialise_numpy_vector_table,
+)
 import numpy as np
-from typing import Any, Tuple, Callable, Dict, Union
+import struct
+from typing import Any, Tuple, Callable, Dict, List, Sequence, Union
 from collections import namedtuple
-
+from functools import lru_cache, partial
 
 FILE_IDENTIFIER = b"f142"
 
@@ -158,7 +154,9 @@ def _complete_buffer(
     timestamp_unix_ns: int,
     alarm_status: Union[int, None] = None,
     alarm_severity: Union[int, None] = None,
-) -> bytearray:
+    out: Union[bytearray, memoryview, None] = None,
+    copy: bool = True,
+) -> Union[bytes, memoryview]:
     LogData.LogDataAddTimestamp(builder, timestamp_unix_ns)
 
     if alarm_status is not None:
@@ -169,13 +167,11 @@ def _complete_buffer(
 
     log_msg = LogData.LogDataEnd(builder)
     builder.Finish(log_msg)
-    buff = builder.Output()
-    buff[4:8] = FILE_IDENTIFIER
-    return buff
+    return output_buffer(builder, FILE_IDENTIFIER, out, copy)
 
 
 def _setup_builder(source_name: str) -> Tuple[flatbuffers.Builder, int]:
-    builder = flatbuffers.Builder(1024)
+    builder = get_builder(1024)
     source = builder.CreateString(source_name)
     return builder, source
 
@@ -190,18 +186,33 @@ def _serialise_byte(builder: flatbuffers.Builder, data: np.ndarray, source: int)
     LogData.LogDataAddValueType(builder, Value.Byte)
 
 
-def _serialise_bytearray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayByteStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependInt8(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayByteStart(builder)
-    ArrayByteAddValue(builder, array_offset)
-    value_position = ArrayByteEnd(builder)
+def _serialise_numeric_array(
+    builder: flatbuffers.Builder,
+    data: np.ndarray,
+    source: int,
+    dtype: type,
+    value_type: int,
+    start: Callable,
+    add_value: Callable,
+    end: Callable,
+):
+    value_position = serialise_numpy_vector_table(
+        builder, data, dtype, start, add_value, end
+    )
     LogData.LogDataStart(builder)
     LogData.LogDataAddSourceName(builder, source)
     LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayByte)
+    LogData.LogDataAddValueType(builder, value_type)
+
+
+_serialise_bytearray = partial(
+    _serialise_numeric_array,
+    dtype=np.int8,
+    value_type=Value.ArrayByte,
+    start=ArrayByteStart,
+    add_value=ArrayByteAddValue,
+    end=ArrayByteEnd,
+)
 
 
 def _serialise_ubyte(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -214,18 +225,14 @@ def _serialise_ubyte(builder: flatbuffers.Builder, data: np.ndarray, source: int
     LogData.LogDataAddValueType(builder, Value.UByte)
 
 
-def _serialise_ubytearray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayUByteStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependUint8(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayUByteStart(builder)
-    ArrayUByteAddValue(builder, array_offset)
-    value_position = ArrayUByteEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayUByte)
+_serialise_ubytearray = partial(
+    _serialise_numeric_array,
+    dtype=np.uint8,
+    value_type=Value.ArrayUByte,
+    start=ArrayUByteStart,
+    add_value=ArrayUByteAddValue,
+    end=ArrayUByteEnd,
+)
 
 
 def _serialise_short(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -238,18 +245,14 @@ def _serialise_short(builder: flatbuffers.Builder, data: np.ndarray, source: int
     LogData.LogDataAddValueType(builder, Value.Short)
 
 
-def _serialise_shortarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayShortStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependInt16(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayShortStart(builder)
-    ArrayShortAddValue(builder, array_offset)
-    value_position = ArrayShortEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayShort)
+_serialise_shortarray = partial(
+    _serialise_numeric_array,
+    dtype=np.int16,
+    value_type=Value.ArrayShort,
+    start=ArrayShortStart,
+    add_value=ArrayShortAddValue,
+    end=ArrayShortEnd,
+)
 
 
 def _serialise_ushort(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -262,18 +265,14 @@ def _serialise_ushort(builder: flatbuffers.Builder, data: np.ndarray, source: in
     LogData.LogDataAddValueType(builder, Value.UShort)
 
 
-def _serialise_ushortarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayUShortStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependUint16(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayUShortStart(builder)
-    ArrayUShortAddValue(builder, array_offset)
-    value_position = ArrayUShortEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayUShort)
+_serialise_ushortarray = partial(
+    _serialise_numeric_array,
+    dtype=np.uint16,
+    value_type=Value.ArrayUShort,
+    start=ArrayUShortStart,
+    add_value=ArrayUShortAddValue,
+    end=ArrayUShortEnd,
+)
 
 
 def _serialise_int(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -286,18 +285,14 @@ def _serialise_int(builder: flatbuffers.Builder, data: np.ndarray, source: int):
     LogData.LogDataAddValueType(builder, Value.Int)
 
 
-def _serialise_intarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayIntStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependInt32(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayIntStart(builder)
-    ArrayIntAddValue(builder, array_offset)
-    value_position = ArrayIntEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayInt)
+_serialise_intarray = partial(
+    _serialise_numeric_array,
+    dtype=np.int32,
+    value_type=Value.ArrayInt,
+    start=ArrayIntStart,
+    add_value=ArrayIntAddValue,
+    end=ArrayIntEnd,
+)
 
 
 def _serialise_uint(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -310,18 +305,14 @@ def _serialise_uint(builder: flatbuffers.Builder, data: np.ndarray, source: int)
     LogData.LogDataAddValueType(builder, Value.UInt)
 
 
-def _serialise_uintarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayUIntStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependUint32(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayUIntStart(builder)
-    ArrayUIntAddValue(builder, array_offset)
-    value_position = ArrayUIntEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayUInt)
+_serialise_uintarray = partial(
+    _serialise_numeric_array,
+    dtype=np.uint32,
+    value_type=Value.ArrayUInt,
+    start=ArrayUIntStart,
+    add_value=ArrayUIntAddValue,
+    end=ArrayUIntEnd,
+)
 
 
 def _serialise_long(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -334,18 +325,14 @@ def _serialise_long(builder: flatbuffers.Builder, data: np.ndarray, source: int)
     LogData.LogDataAddValueType(builder, Value.Long)
 
 
-def _serialise_longarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayLongStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependInt64(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayLongStart(builder)
-    ArrayLongAddValue(builder, array_offset)
-    value_position = ArrayLongEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayLong)
+_serialise_longarray = partial(
+    _serialise_numeric_array,
+    dtype=np.int64,
+    value_type=Value.ArrayLong,
+    start=ArrayLongStart,
+    add_value=ArrayLongAddValue,
+    end=ArrayLongEnd,
+)
 
 
 def _serialise_ulong(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -358,18 +345,14 @@ def _serialise_ulong(builder: flatbuffers.Builder, data: np.ndarray, source: int
     LogData.LogDataAddValueType(builder, Value.ULong)
 
 
-def _serialise_ulongarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayULongStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependUint64(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayULongStart(builder)
-    ArrayULongAddValue(builder, array_offset)
-    value_position = ArrayULongEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayULong)
+_serialise_ulongarray = partial(
+    _serialise_numeric_array,
+    dtype=np.uint64,
+    value_type=Value.ArrayULong,
+    start=ArrayULongStart,
+    add_value=ArrayULongAddValue,
+    end=ArrayULongEnd,
+)
 
 
 def _serialise_float(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -382,18 +365,14 @@ def _serialise_float(builder: flatbuffers.Builder, data: np.ndarray, source: int
     LogData.LogDataAddValueType(builder, Value.Float)
 
 
-def _serialise_floatarray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayFloatStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependFloat32(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayFloatStart(builder)
-    ArrayFloatAddValue(builder, array_offset)
-    value_position = ArrayFloatEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayFloat)
+_serialise_floatarray = partial(
+    _serialise_numeric_array,
+    dtype=np.float32,
+    value_type=Value.ArrayFloat,
+    start=ArrayFloatStart,
+    add_value=ArrayFloatAddValue,
+    end=ArrayFloatEnd,
+)
 
 
 def _serialise_double(builder: flatbuffers.Builder, data: np.ndarray, source: int):
@@ -406,22 +385,18 @@ def _serialise_double(builder: flatbuffers.Builder, data: np.ndarray, source: in
     LogData.LogDataAddValueType(builder, Value.Double)
 
 
-def _serialise_doublearray(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    ArrayDoubleStartValueVector(builder, len(data))
-    for single_value in reversed(data):
-        builder.PrependFloat64(single_value)
-    array_offset = builder.EndVector(len(data))
-    ArrayDoubleStart(builder)
-    ArrayDoubleAddValue(builder, array_offset)
-    value_position = ArrayDoubleEnd(builder)
-    LogData.LogDataStart(builder)
-    LogData.LogDataAddSourceName(builder, source)
-    LogData.LogDataAddValue(builder, value_position)
-    LogData.LogDataAddValueType(builder, Value.ArrayDouble)
+_serialise_doublearray = partial(
+    _serialise_numeric_array,
+    dtype=np.float64,
+    value_type=Value.ArrayDouble,
+    start=ArrayDoubleStart,
+    add_value=ArrayDoubleAddValue,
+    end=ArrayDoubleEnd,
+)
 
 
-def _serialise_string(builder: flatbuffers.Builder, data: np.ndarray, source: int):
-    string_offset = builder.CreateString(data.item())
+def _serialise_string(builder: flatbuffers.Builder, data: Any, source: int):
+    string_offset = builder.CreateString(data if isinstance(data, str) else data.item())
     StringStart(builder)
     StringAddValue(builder, string_offset)
     value_position = StringEnd(builder)
@@ -485,7 +460,9 @@ def serialise_f142(
     timestamp_unix_ns: int = 0,
     alarm_status: Union[int, None] = None,
     alarm_severity: Union[int, None] = None,
-) -> bytes:
+    out: Union[bytearray, memoryview, None] = None,
+    copy: bool = True,
+) -> Union[bytes, memoryview]:
     """
     Serialise value and corresponding timestamp as an f142 Flatbuffer message.
     Should automagically use a sensible type for value in the message, but if
@@ -496,8 +473,24 @@ def serialise_f142(
     :param timestamp_unix_ns: timestamp corresponding to value, e.g. when value was measured, in nanoseconds
     :param alarm_status: EPICS alarm status, best to provide using enum-like class defined in logdata_f142.AlarmStatus
     :param alarm_severity: EPICS alarm severity, best to provide using enum-like class defined in logdata_f142.AlarmSeverity
+    :param out: optional writable buffer to write the message into, a memoryview of the written region is returned
+    :param copy: if False return a memoryview over the builder's memory rather than a copy of the message
     """
+    dtype = _scalar_dtype(value)
+    if dtype is not None:
+        # Numeric scalars are patched into a cached template for the source
+        message = _scalar_encoder(source_name, dtype).encode(
+            value, timestamp_unix_ns, alarm_status, alarm_severity, out
+        )
+        return message if copy or out is not None else memoryview(message)
+
     builder, source = _setup_builder(source_name)
+    if type(value) is str:
+        _serialise_string(builder, value, source)
+        return _complete_buffer(
+            builder, timestamp_unix_ns, alarm_status, alarm_severity, out, copy
+        )
+
     value = np.array(value)
 
     if value.ndim == 0:
@@ -515,11 +508,39 @@ def serialise_f142(
     else:
         raise NotImplementedError("f142 only supports scalars or 1D array values")
 
-    return bytes(
-        _complete_buffer(builder, timestamp_unix_ns, alarm_status, alarm_severity)
+    return _complete_buffer(
+        builder, timestamp_unix_ns, alarm_status, alarm_severity, out, copy
     )
 
 
+# The dtypes np.array gives Python and NumPy scalar types, NumPy scalar types are
+# added as they are first seen
+_scalar_type_to_dtype = {float: np.dtype(np.float64)}
+_default_int_dtype = np.array(0).dtype
+_default_int_range = range(
+    np.iinfo(_default_int_dtype).min, np.iinfo(_default_int_dtype).max + 1
+)
+
+
+def _scalar_dtype(value: Any) -> Union[np.dtype, None]:
+    # Resolves the dtype of numeric scalars without creating an array, or returns
+    # None if the value needs the general np.array path
+    value_type = type(value)
+    try:
+        return _scalar_type_to_dtype[value_type]
+    except KeyError:
+        pass
+    if value_type is int:
+        # Larger ints become a different type, or fail, in np.array
+        return _default_int_dtype if value in _default_int_range else None
+    if issubclass(value_type, np.generic):
+        dtype = np.dtype(value_type)
+        if dtype in _map_scalar_type_to_serialiser:
+            _scalar_type_to_dtype[value_type] = dtype
+            return dtype
+    return None
+
+
 def _serialise_value(
     builder: flatbuffers.Builder,
     source: int,
@@ -544,6 +565,272 @@ def _serialise_value(
             )
 
 
+# struct formats of the scalar value types, for patching values into a template
+_map_scalar_value_type_to_format = {
+    Value.Byte: struct.Struct("<b"),
+    Value.UByte: struct.Struct("<B"),
+    Value.Short: struct.Struct("<h"),
+    Value.UShort: struct.Struct("<H"),
+    Value.Int: struct.Struct("<i"),
+    Value.UInt: struct.Struct("<I"),
+    Value.Long: struct.Struct("<q"),
+    Value.ULong: struct.Struct("<Q"),
+    Value.Float: struct.Struct("<f"),
+    Value.Double: struct.Struct("<d"),
+}
+
+_timestamp_format = struct.Struct("<Q")
+_alarm_format = struct.Struct("<H")
+
+# The values deserialise_f142 returns when the alarm fields are absent
+_DEFAULT_ALARM_STATUS = 22
+_DEFAULT_ALARM_SEVERITY = 4
+
+_uoffset = struct.Struct("<I")
+_soffset = struct.Struct("<i")
+_voffset = struct.Struct("<H")
+
+# vtable offsets of the LogData fields and of the value field of the value tables
+_SOURCE_NAME_FIELD = 4
+_VALUE_TYPE_FIELD = 6
+_VALUE_FIELD = 8
+_TIMESTAMP_FIELD = 10
+_STATUS_FIELD = 12
+_SEVERITY_FIELD = 14
+_SCALAR_VALUE_FIELD = 4
+
+# A scalar message template and the positions of the fields patched into it, the
+# alarm positions are None in templates without alarm fields
+_ScalarTemplate = namedtuple(
+    "_ScalarTemplate",
+    (
+        "message",
+        "value_position",
+        "timestamp_position",
+        "status_position",
+        "severity_position",
+    ),
+)
+
+
+def _build_scalar_template(
+    source_name: str, dtype: np.dtype, with_alarms: bool
+) -> _ScalarTemplate:
+    builder, source = _setup_builder(source_name)
+    # Fields equal to their defaults are not written, so the template is built from
+    # placeholders that differ from the defaults and are patched over
+    _map_scalar_type_to_serialiser[dtype](builder, np.array(1, dtype), source)
+    if with_alarms:
+        message = _complete_buffer(builder, 1, 0, 0)
+    else:
+        message = _complete_buffer(builder, 1)
+
+    log_data = LogData.LogData.GetRootAsLogData(message, 0)
+    value_table = log_data.Value()
+    log_data_position = log_data._tab.Pos
+    status_position = severity_position = None
+    if with_alarms:
+        status_position = log_data_position + log_data._tab.Offset(_STATUS_FIELD)
+        severity_position = log_data_position + log_data._tab.Offset(_SEVERITY_FIELD)
+    return _ScalarTemplate(
+        message,
+        value_table.Pos + value_table.Offset(_SCALAR_VALUE_FIELD),
+        log_data_position + log_data._tab.Offset(_TIMESTAMP_FIELD),
+        status_position,
+        severity_position,
+    )
+
+
+class F142ScalarEncoder:
+    """
+    Serialises scalar f142 messages for one source and value type.
+
+    The message layout is built once as a template, with and without the alarm
+    fields. Each message is then a copy of a template with the value, timestamp and
+    alarm fields written into it, rather than being rebuilt with a FlatBuffers
+    builder. The messages deserialise to the same values as those built with a
+    builder. They are also the same bytes, except when the value or timestamp is 0
+    or there is an alarm status without a severity: a builder leaves out fields
+    equal to their defaults, but the template always has them.
+    """
+
+    def __init__(self, source_name: str, dtype: Any = np.float64):
+        """
+        :param source_name: name of the data source
+        :param dtype: numeric type of the values, as accepted by np.dtype
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in _map_scalar_type_to_serialiser:
+            raise NotImplementedError(
+                f"Cannot encode data of type {dtype}, must use one of "
+                f"{list(_map_scalar_type_to_serialiser.keys())}"
+            )
+        self.source_name = source_name
+        self.dtype = dtype
+        self._template = _build_scalar_template(source_name, dtype, False)
+        self._alarm_template = _build_scalar_template(source_name, dtype, True)
+        log_data = LogData.LogData.GetRootAsLogData(self._template.message, 0)
+        self._value_format = _map_scalar_value_type_to_format[log_data.ValueType()]
+
+    def encode(
+        self,
+        value: Any,
+        timestamp_unix_ns: int = 0,
+        alarm_status: Union[int, None] = None,
+        alarm_severity: Union[int, None] = None,
+        out: Union[bytearray, memoryview, None] = None,
+    ) -> Union[bytes, memoryview]:
+        """
+        Serialise a value as an f142 message.
+
+        :param value: the scalar value, it must fit in the encoder's type
+        :param timestamp_unix_ns: timestamp corresponding to value, in nanoseconds
+        :param alarm_status: EPICS alarm status
+        :param alarm_severity: EPICS alarm severity, ignored if there is no status
+        :param out: optional writable buffer to write the message into, a memoryview
+            of the written region is returned
+        :return: the message
+        """
+        template = self._template if alarm_status is None else self._alarm_template
+        if out is None:
+            message = bytearray(template.message)
+        else:
+            message = memoryview(out).cast("B")
+            if len(message) < len(template.message):
+                raise ValueError(
+                    f"Output buffer too small: message is {len(template.message)} "
+                    f"bytes but buffer is {len(message)} bytes"
+                )
+            message = message[: len(template.message)]
+            message[:] = template.message
+
+        self._value_format.pack_into(message, template.value_position, value)
+        _timestamp_format.pack_into(
+            message, template.timestamp_position, timestamp_unix_ns
+        )
+        if alarm_status is not None:
+            if alarm_severity is None:
+                alarm_severity = _DEFAULT_ALARM_SEVERITY
+            _alarm_format.pack_into(message, template.status_position, alarm_status)
+            _alarm_format.pack_into(message, template.severity_position, alarm_severity)
+
+        return message if out is not None else bytes(message)
+
+
+@lru_cache(maxsize=4096)
+def _scalar_encoder(source_name: str, dtype: np.dtype) -> F142ScalarEncoder:
+    return F142ScalarEncoder(source_name, dtype)
+
+
+PackedMessages = namedtuple("PackedMessages", ("buffer", "offsets"))
+
+
+def serialise_f142_batch(
+    source_names: Union[str, Sequence[str]],
+    values: Any,
+    timestamps_unix_ns: Any = 0,
+    alarm_statuses: Any = None,
+    alarm_severities: Any = None,
+    packed: bool = False,
+) -> Union[List[bytes], PackedMessages]:
+    """
+    Serialise many scalar values as f142 messages.
+
+    The inputs are columns, one entry per message, and scalars are broadcast. Each
+    distinct source name is laid out once as a cached template, then all the
+    messages are assembled from the templates and the value, timestamp and alarm
+    columns with vectorised NumPy operations.
+
+    :param source_names: name of the data source of each message, or one name for all
+    :param values: the numeric values, all serialised with the dtype of the array
+    :param timestamps_unix_ns: timestamp corresponding to each value, in nanoseconds
+    :param alarm_statuses: EPICS alarm status of each message
+    :param alarm_severities: EPICS alarm severity of each message, ignored if there
+        are no statuses
+    :param packed: if True return all the messages in one buffer, message i is
+        buffer[offsets[i]:offsets[i + 1]]
+    :return: the messages, as a list or packed
+    """
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("Values must be a 1D array")
+    if values.dtype not in _map_scalar_type_to_serialiser:
+        raise NotImplementedError(
+            f"Cannot serialise data of type {values.dtype}, must use one of "
+            f"{list(_map_scalar_type_to_serialiser.keys())}"
+        )
+    number_of_messages = len(values)
+    if not isinstance(source_names, str) and len(source_names) != number_of_messages:
+        raise ValueError(
+            f"{len(source_names)} source names but {number_of_messages} values"
+        )
+    if number_of_messages == 0:
+        return PackedMessages(b"", np.zeros(1, dtype=np.int64)) if packed else []
+
+    # Intern the source names, so each distinct one is only looked up once
+    if isinstance(source_names, str):
+        source_names = [source_names]
+        source_index = np.zeros(number_of_messages, dtype=np.int64)
+    else:
+        interned = {}
+        source_index = np.fromiter(
+            (interned.setdefault(name, len(interned)) for name in source_names),
+            dtype=np.int64,
+            count=number_of_messages,
+        )
+        source_names = list(interned)
+    encoders = [_scalar_encoder(name, values.dtype) for name in source_names]
+
+    # Messages only have the alarm fields if alarm statuses are given
+    if alarm_statuses is None:
+        templates = [encoder._template for encoder in encoders]
+    else:
+        templates = [encoder._alarm_template for encoder in encoders]
+        if alarm_severities is None:
+            alarm_severities = _DEFAULT_ALARM_SEVERITY
+
+    # One row per message, copied from a table of the sources' templates padded to
+    # the longest one
+    lengths = np.array([len(template.message) for template in templates])
+    template_table = np.zeros((len(templates), lengths.max()), dtype=np.uint8)
+    for row, template in zip(template_table, templates):
+        row[: len(template.message)] = np.frombuffer(template.message, np.uint8)
+    messages = template_table[source_index]
+    lengths = lengths[source_index]
+    rows = np.arange(number_of_messages)[:, np.newaxis]
+
+    def patch(field, column, dtype):
+        positions = np.array([getattr(template, field) for template in templates])
+        column = np.asarray(column).astype(np.dtype(dtype).newbyteorder("<"))
+        column = np.ascontiguousarray(np.broadcast_to(column, number_of_messages))
+        columns = positions[source_index][:, np.newaxis] + np.arange(
+            column.dtype.itemsize
+        )
+        messages[rows, columns] = column.view(np.uint8).reshape(columns.shape)
+
+    # Written as the template's value type, which can be wider than the values' type
+    patch("value_position", values, encoders[0]._value_format.format)
+    patch("timestamp_position", timestamps_unix_ns, np.uint64)
+    if alarm_statuses is not None:
+        patch("status_position", alarm_statuses, np.uint16)
+        patch("severity_position", alarm_severities, np.uint16)
+
+    offsets = np.zeros(number_of_messages + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if np.all(lengths == messages.shape[1]):
+        buffer = messages.tobytes()
+    else:
+        # Drop the padding of messages shorter than the longest template
+        buffer = messages[np.arange(messages.shape[1]) < lengths[:, np.newaxis]]
+        buffer = buffer.tobytes()
+    if packed:
+        return PackedMessages(buffer, offsets)
+    return [
+        buffer[start:end]
+        for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    ]
+
+
 _map_fb_enum_to_type = {
     Value.Byte: Byte,
     Value.UByte: UByte,
@@ -585,8 +872,11 @@ def _decode_if_scalar_string(value: np.ndarray) -> Union[str, np.ndarray]:
     return value
 
 
-def deserialise_f142(buffer: Union[bytearray, bytes]) -> LogDataInfo:
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+def deserialise_f142(
+    buffer: Union[bytearray, bytes], check_identifier: bool = True
+) -> LogDataInfo:
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     log_data = LogData.LogData.GetRootAsLogData(buffer, 0)
     source_name = log_data.SourceName() if log_data.SourceName() else b""
@@ -614,3 +904,127 @@ def deserialise_f142(buffer: Union[bytearray, bytes]) -> LogDataInfo:
     return LogDataInfo(
         value, source_name.decode(), timestamp, log_data.Status(), log_data.Severity()
     )
+
+
+def _field_positions(buffer, table: int, fields: Tuple[int, ...]) -> List:
+    # The positions of a table's fields in the buffer, or None for absent fields
+    vtable = table - _soffset.unpack_from(buffer, table)[0]
+    vtable_size = _voffset.unpack_from(buffer, vtable)[0]
+    positions = []
+    for field in fields:
+        offset = (
+            _voffset.unpack_from(buffer, vtable + field)[0]
+            if field < vtable_size
+            else 0
+        )
+        positions.append(table + offset if offset else None)
+    return positions
+
+
+LogDataBatch = namedtuple(
+    "LogDataBatch",
+    (
+        "value",
+        "source_index",
+        "source_names",
+        "timestamp_unix_ns",
+        "alarm_status",
+        "alarm_severity",
+    ),
+)
+
+
+def deserialise_f142_batch(
+    buffers, value_dtype: Any = np.float64, check_identifier: bool = True
+) -> LogDataBatch:
+    """
+    Deserialise many scalar f142 messages into columns.
+
+    The fields are read straight from each buffer's tables rather than through
+    the generated classes, and collected into one array per field. The source name
+    of message i is source_names[source_index[i]].
+
+    :param buffers: The FlatBuffers buffers, they must all have numeric scalar values.
+    :param value_dtype: The type of the value column, all values are converted to it.
+    :param check_identifier: Whether to check the buffers' schema identifiers.
+    :return: The deserialised data.
+    """
+    values = []
+    source_index = []
+    timestamps = []
+    statuses = []
+    severities = []
+    interned = {}
+
+    for i, buffer in enumerate(buffers):
+        if check_identifier:
+            check_schema_identifier(buffer, FILE_IDENTIFIER)
+        table = _uoffset.unpack_from(buffer, 0)[0]
+        (
+            source_position,
+            value_type_position,
+            value_position,
+            timestamp_position,
+            status_position,
+            severity_position,
+        ) = _field_positions(
+            buffer,
+            table,
+            (
+                _SOURCE_NAME_FIELD,
+                _VALUE_TYPE_FIELD,
+                _VALUE_FIELD,
+                _TIMESTAMP_FIELD,
+                _STATUS_FIELD,
+                _SEVERITY_FIELD,
+            ),
+        )
+
+        value_type = buffer[value_type_position] if value_type_position else 0
+        try:
+            value_format = _map_scalar_value_type_to_format[value_type]
+        except KeyError:
+            raise ValueError(f"Message {i} does not have a numeric scalar value")
+        value_table = value_position + _uoffset.unpack_from(buffer, value_position)[0]
+        (scalar_position,) = _field_positions(
+            buffer, value_table, (_SCALAR_VALUE_FIELD,)
+        )
+        values.append(
+            value_format.unpack_from(buffer, scalar_position)[0]
+            if scalar_position
+            else 0
+        )
+
+        if source_position:
+            source_position += _uoffset.unpack_from(buffer, source_position)[0]
+            length = _uoffset.unpack_from(buffer, source_position)[0]
+            start = source_position + _uoffset.size
+            source_name = bytes(buffer[start : start + length])
+        else:
+            source_name = b""
+        source_index.append(interned.setdefault(source_name, len(interned)))
+
+        timestamps.append(
+            _timestamp_format.unpack_from(buffer, timestamp_position)[0]
+            if timestamp_position
+            else 0
+        )
+        statuses.append(
+            _alarm_format.unpack_from(buffer, status_position)[0]
+            if status_position
+            else _DEFAULT_ALARM_STATUS
+        )
+        severities.append(
+            _alarm_format.unpack_from(buffer, severity_position)[0]
+            if severity_position
+            else _DEFAULT_ALARM_SEVERITY
+        )
+
+    return LogDataBatch(
+        np.array(values, dtype=value_dtype),
+        np.array(source_index, dtype=np.int64),
+        [source_name.decode() for source_name in interned],
+        np.array(timestamps, dtype=np.uint64),
+        np.array(statuses, dtype=np.uint16),
+        np.array(severities, dtype=np.uint16),
+    )
@@ -1,7 +1,10 @@
 from collections import namedtuple
-import flatbuffers
 from streaming_data_types.fbschemas.nicos_cache_ns10 import CacheEntry
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+)
 
 
 FILE_IDENTIFIER = b"ns10"
@@ -10,7 +13,7 @@ FILE_IDENTIFIER = b"ns10"
 def serialise_ns10(
     key: str, value: str, time_stamp: float = 0, ttl: float = 0, expired: bool = False
 ):
-    builder = flatbuffers.Builder(128)
+    builder = get_builder(128)
 
     value_offset = builder.CreateString(value)
     key_offset = builder.CreateString(key)
@@ -25,14 +28,12 @@ def serialise_ns10(
     builder.Finish(cache_entry_message)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
+    return output_buffer(builder, FILE_IDENTIFIER)
 
-    return bytes(buffer)
 
-
-def deserialise_ns10(buffer):
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+def deserialise_ns10(buffer, check_identifier=True):
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     entry = CacheEntry.CacheEntry.GetRootAsCacheEntry(buffer, 0)
 
@@ -0,0 +1,254 @@
+import multiprocessing
+import os
+import queue
+import traceback
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Union
+import numpy as np
+from streaming_data_types.event_histogrammer import EventHistogrammer
+from streaming_data_types.eventdata_ev42 import EventDataView
+
+# How often to check the workers are still running while waiting for one
+_WORKER_CHECK_INTERVAL_S = 0.1
+
+
+def _histogram_slots(
+    tof_edges,
+    detector_edges,
+    shape,
+    counts_name: str,
+    input_name: str,
+    slot_size: int,
+    tasks,
+    free_slots,
+):
+    # Worker process: histogram the ev42 messages in the input slots it is sent into
+    # its own partial histogram in shared memory, returning each slot once done
+    counts_memory = SharedMemory(counts_name)
+    input_memory = SharedMemory(input_name)
+    try:
+        histogrammer = EventHistogrammer(
+            tof_edges,
+            detector_edges,
+            counts=np.ndarray(shape, np.uint64, buffer=counts_memory.buf),
+        )
+        for slot, length in iter(tasks.get, None):
+            error = None
+            try:
+                start = slot * slot_size
+                histogrammer.add_ev42(input_memory.buf[start : start + length])
+            except Exception:
+                error = traceback.format_exc()
+            free_slots.put((slot, error))
+        # Views of the shared memory must be gone before it can be closed
+        del histogrammer
+    finally:
+        counts_memory.close()
+        input_memory.close()
+
+
+class ParallelEventHistogrammer:
+    """
+    Histograms ev42 messages in a pool of worker processes.
+
+    Each message is copied into a slot of a shared memory input buffer and the next
+    free worker histograms it into its own partial histogram, which is also in shared
+    memory. The partial histograms are summed when the result is needed, so neither
+    messages nor event arrays are ever pickled.
+
+    Requires Python 3.8 or later. Use as a context manager, or call close when done.
+    """
+
+    def __init__(
+        self,
+        tof_edges,
+        detector_edges,
+        source: str = "",
+        number_of_workers: Optional[int] = None,
+        slots_per_worker: int = 2,
+        slot_size: int = 8 * 1024 * 1024,
+    ):
+        """
+        :param tof_edges: bin edges for time of flight
+        :param detector_edges: bin edges for detector id
+        :param source: the source name used in the hs00 message
+        :param number_of_workers: the number of worker processes, defaults to the
+            number of CPUs
+        :param slots_per_worker: the number of messages that can be queued per worker
+        :param slot_size: the largest message size in bytes
+        """
+        self._histogrammer = EventHistogrammer(tof_edges, detector_edges, source)
+        self._slot_size = slot_size
+        number_of_workers = number_of_workers or os.cpu_count() or 1
+        number_of_slots = number_of_workers * slots_per_worker
+
+        self._input_memory = SharedMemory(create=True, size=number_of_slots * slot_size)
+        self._counts_memory = []
+        self._partial_counts = []
+        self._workers = []
+        self._tasks = multiprocessing.Queue()
+        self._free_slots = multiprocessing.Queue()
+        self._errors = []
+        self._available_slots = list(range(number_of_slots))
+        self._number_of_slots = number_of_slots
+
+        try:
+            for _ in range(number_of_workers):
+                self._start_worker(tof_edges, detector_edges)
+        except Exception:
+            self.close()
+            raise
+
+    def _start_worker(self, tof_edges, detector_edges):
+        counts = self._histogrammer.counts
+        memory = SharedMemory(create=True, size=max(counts.nbytes, 1))
+        self._counts_memory.append(memory)
+        partial_counts = np.ndarray(counts.shape, np.uint64, buffer=memory.buf)
+        partial_counts.fill(0)
+        self._partial_counts.append(partial_counts)
+        worker = multiprocessing.Process(
+            target=_histogram_slots,
+            args=(
+                tof_edges,
+                detector_edges,
+                counts.shape,
+                memory.name,
+                self._input_memory.name,
+                self._slot_size,
+                self._tasks,
+                self._free_slots,
+            ),
+            daemon=True,
+        )
+        worker.start()
+        self._workers.append(worker)
+
+    def add_ev42(self, buffer: Union[bytes, bytearray, memoryview]):
+        """
+        Queue an ev42 message to be histogrammed, blocks if all the slots are in use.
+
+        :param buffer: the ev42 FlatBuffers buffer
+        """
+        length = len(buffer)
+        if length > self._slot_size:
+            raise ValueError(
+                f"Message of {length} bytes is larger than the slot size of "
+                f"{self._slot_size} bytes"
+            )
+        view = EventDataView(buffer)
+        if not self._available_slots:
+            self._collect_free_slot()
+        slot = self._available_slots.pop()
+        start = slot * self._slot_size
+        self._input_memory.buf[start : start + length] = buffer
+        self._tasks.put((slot, length))
+        self._histogrammer.last_pulse_time = view.pulse_time
+
+    def _collect_free_slot(self):
+        while True:
+            try:
+                slot, error = self._free_slots.get(timeout=_WORKER_CHECK_INTERVAL_S)
+                break
+            except queue.Empty:
+                # A worker that has exited will never return the slot it was given
+                for worker in self._workers:
+                    if not worker.is_alive():
+                        raise RuntimeError(
+                            f"Histogram worker exited with code {worker.exitcode}"
+                        )
+        self._available_slots.append(slot)
+        if error is not None:
+            self._errors.append(error)
+
+    def wait(self):
+        """
+        Wait until all queued messages have been histogrammed.
+
+        :raises RuntimeError: if any of the messages could not be histogrammed, or a
+            worker has exited
+        """
+        while len(self._available_slots) < self._number_of_slots:
+            self._collect_free_slot()
+        errors, self._errors = self._errors, []
+        if errors:
+            raise RuntimeError(
+                f"{len(errors)} messages could not be histogrammed:\n{errors[0]}"
+            )
+
+    def _merge(self):
+        # Sum the workers' partial histograms into the histogrammer's counts
+        counts = self._histogrammer.counts
+        np.copyto(counts, self._partial_counts[0])
+        for partial_counts in self._partial_counts[1:]:
+            counts += partial_counts
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        The merged counts of all the workers, waits for queued messages first
+        """
+        self.wait()
+        self._merge()
+        return self._histogrammer.counts
+
+    @property
+    def last_pulse_time(self) -> int:
+        """
+        The pulse time of the most recently added ev42 message
+        """
+        return self._histogrammer.last_pulse_time
+
+    def reset(self):
+        """
+        Wait for queued messages, then set all counts to zero.
+        """
+        self.wait()
+        for partial_counts in self._partial_counts:
+            partial_counts.fill(0)
+        self._histogrammer.reset()
+
+    def to_hs00_dict(self, timestamp: Optional[int] = None) -> dict:
+        """
+        Get the merged histogram as a dictionary as used by serialise_hs00.
+
+        :param timestamp: the histogram timestamp, defaults to the last pulse time
+        :return: the histogram dictionary
+        """
+        self.wait()
+        self._merge()
+        return self._histogrammer.to_hs00_dict(timestamp)
+
+    def serialise(self, timestamp: Optional[int] = None) -> bytes:
+        """
+        Serialise the merged histogram as an hs00 FlatBuffers message.
+
+        :param timestamp: the histogram timestamp, defaults to the last pulse time
+        :return: the hs00 message
+        """
+        self.wait()
+        self._merge()
+        return self._histogrammer.serialise(timestamp)
+
+    def close(self):
+        """
+        Stop the workers and free the shared memory, does nothing if already closed.
+        """
+        if self._input_memory is None:
+            return
+        for _ in self._workers:
+            self._tasks.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        self._partial_counts = []
+        for memory in self._counts_memory + [self._input_memory]:
+            memory.close()
+            memory.unlink()
+        self._counts_memory = []
+        self._input_memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
@@ -1,13 +1,58 @@
+import functools
+import json
 import time
 from typing import Optional, Union
-import flatbuffers
-from streaming_data_types.fbschemas.run_start_pl72 import RunStart
-from streaming_data_types.utils import check_schema_identifier
+import numpy as np
+from streaming_data_types.fbschemas.run_start_pl72 import (
+    RunStart,
+    SpectraDetectorMapping,
+)
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+    serialise_numpy_vector,
+)
 from collections import namedtuple
 
 FILE_IDENTIFIER = b"pl72"
 
 
+DetectorSpectrumMap = namedtuple(
+    "DetectorSpectrumMap", ("spectrum_numbers", "detector_ids", "n_spectra")
+)
+
+
+def _serialise_detector_spectrum_map(builder, detector_spectrum_map):
+    spectrum_offset = serialise_numpy_vector(
+        builder, detector_spectrum_map.spectrum_numbers, np.int32
+    )
+    detector_id_offset = serialise_numpy_vector(
+        builder, detector_spectrum_map.detector_ids, np.int32
+    )
+    SpectraDetectorMapping.SpectraDetectorMappingStart(builder)
+    SpectraDetectorMapping.SpectraDetectorMappingAddSpectrum(builder, spectrum_offset)
+    SpectraDetectorMapping.SpectraDetectorMappingAddDetectorId(
+        builder, detector_id_offset
+    )
+    SpectraDetectorMapping.SpectraDetectorMappingAddNSpectra(
+        builder, detector_spectrum_map.n_spectra
+    )
+    return SpectraDetectorMapping.SpectraDetectorMappingEnd(builder)
+
+
+def _estimate_message_size(detector_spectrum_map):
+    # The strings usually fit in the default size, the spectrum map is dominated by
+    # its two 4 byte values per detector
+    if detector_spectrum_map is None:
+        return 136
+    return (
+        200
+        + 4 * len(detector_spectrum_map.spectrum_numbers)
+        + 4 * len(detector_spectrum_map.detector_ids)
+    )
+
+
 def serialise_pl72(
     job_id: str,
     filename: str,
@@ -18,8 +63,10 @@ def serialise_pl72(
     service_id: str = "",
     instrument_name: str = "TEST",
     broker: str = "localhost:9092",
+    n_periods: int = 1,
+    detector_spectrum_map: Optional[DetectorSpectrumMap] = None,
 ) -> bytes:
-    builder = flatbuffers.Builder(136)
+    builder = get_builder(_estimate_message_size(detector_spectrum_map))
 
     if start_time is None:
         start_time = int(time.time() * 1000)
@@ -35,6 +82,10 @@ def serialise_pl72(
     instrument_name_offset = builder.CreateString(instrument_name)
     run_name_offset = builder.CreateString(run_name)
     filename_offset = builder.CreateString(filename)
+    if detector_spectrum_map is not None:
+        detector_spectrum_map_offset = _serialise_detector_spectrum_map(
+            builder, detector_spectrum_map
+        )
 
     # Build the actual buffer
     RunStart.RunStartStart(builder)
@@ -47,20 +98,37 @@ def serialise_pl72(
     RunStart.RunStartAddStopTime(builder, stop_time)
     RunStart.RunStartAddStartTime(builder, start_time)
     RunStart.RunStartAddFilename(builder, filename_offset)
-    RunStart.RunStartAddNPeriods(builder, 1)
+    RunStart.RunStartAddNPeriods(builder, n_periods)
+    if detector_spectrum_map is not None:
+        RunStart.RunStartAddDetectorSpectrumMap(builder, detector_spectrum_map_offset)
 
     run_start_message = RunStart.RunStartEnd(builder)
     builder.Finish(run_start_message)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER)
+
+
+_NOT_DECODED = object()
+
 
+@functools.lru_cache(maxsize=8)
+def _parse_nexus_structure(nexus_structure: Union[bytes, str]):
+    # Memoised on the content, so replayed run starts with the same structure are
+    # only hashed and compared, not parsed again
+    return json.loads(nexus_structure)
 
-RunStartInfo = namedtuple(
-    "RunStartInfo",
-    (
+
+class RunStartInfo:
+    """
+    Deserialised FlatBuffer pl72.
+
+    Behaves like a namedtuple of its fields, except that nexus_structure, which can
+    be megabytes of JSON, is only decoded from the buffer when it is first accessed.
+    The buffer must not be modified until then.
+    """
+
+    _fields = (
         "job_id",
         "filename",
         "start_time",
@@ -70,30 +138,150 @@ RunStartInfo = namedtuple(
         "service_id",
         "instrument_name",
         "broker",
-    ),
-)
+        "n_periods",
+        "detector_spectrum_map",
+    )
+
+    __slots__ = tuple(field for field in _fields if field != "nexus_structure") + (
+        "_nexus_structure",
+        "_run_start",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        filename: str,
+        start_time: int,
+        stop_time: int,
+        run_name: str,
+        nexus_structure: str,
+        service_id: str,
+        instrument_name: str,
+        broker: str,
+        n_periods: int = 1,
+        detector_spectrum_map: Optional[DetectorSpectrumMap] = None,
+    ):
+        self.job_id = job_id
+        self.filename = filename
+        self.start_time = start_time
+        self.stop_time = stop_time
+        self.run_name = run_name
+        self._nexus_structure = nexus_structure
+        self.service_id = service_id
+        self.instrument_name = instrument_name
+        self.broker = broker
+        self.n_periods = n_periods
+        self.detector_spectrum_map = detector_spectrum_map
+        self._run_start = None
+
+    def _raw_nexus_structure(self) -> Union[bytes, str]:
+        if self._nexus_structure is not _NOT_DECODED:
+            return self._nexus_structure
+        nexus_structure = self._run_start.NexusStructure()
+        return nexus_structure if nexus_structure else b""
+
+    @property
+    def nexus_structure(self) -> str:
+        if self._nexus_structure is _NOT_DECODED:
+            self._nexus_structure = self._raw_nexus_structure().decode()
+            self._run_start = None
+        return self._nexus_structure
+
+    @property
+    def nexus_structure_json(self):
+        """
+        The nexus structure parsed from JSON.
+
+        Parsed structures are cached by content and shared between results, so they
+        must not be modified.
+        """
+        return _parse_nexus_structure(self._raw_nexus_structure())
+
+    def _asdict(self) -> dict:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def _replace(self, **kwargs) -> "RunStartInfo":
+        unknown = set(kwargs) - set(self._fields)
+        if unknown:
+            raise ValueError(f"Got unexpected field names: {sorted(unknown)}")
+        return RunStartInfo(**{**self._asdict(), **kwargs})
+
+    def __reduce__(self):
+        # Pickled and copied with nexus_structure decoded, as the buffer may not be
+        # picklable and the not-decoded marker is only valid in this process
+        return RunStartInfo, tuple(self)
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        # By field, so nexus_structure is only decoded if it is asked for
+        if isinstance(index, slice):
+            return tuple(getattr(self, field) for field in self._fields[index])
+        return getattr(self, self._fields[index])
+
+    def __eq__(self, other):
+        if not isinstance(other, (RunStartInfo, tuple)):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{field}={value!r}" for field, value in self._asdict().items()
+        )
+        return f"RunStartInfo({fields})"
+
+
+def _deserialise_detector_spectrum_map(run_start):
+    spectrum_map = run_start.DetectorSpectrumMap()
+    if spectrum_map is None:
+        return None
+
+    # The generated AsNumpy accessors return 0 rather than an array for missing
+    # vectors
+    def as_numpy(vector):
+        return vector if isinstance(vector, np.ndarray) else np.empty(0, np.int32)
+
+    return DetectorSpectrumMap(
+        as_numpy(spectrum_map.SpectrumAsNumpy()),
+        as_numpy(spectrum_map.DetectorIdAsNumpy()),
+        spectrum_map.NSpectra(),
+    )
 
 
-def deserialise_pl72(buffer: Union[bytearray, bytes]) -> RunStartInfo:
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+def deserialise_pl72(
+    buffer: Union[bytearray, bytes], check_identifier: bool = True
+) -> RunStartInfo:
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     run_start = RunStart.RunStart.GetRootAsRunStart(buffer, 0)
     service_id = run_start.ServiceId() if run_start.ServiceId() else b""
     broker = run_start.Broker() if run_start.Broker() else b""
     job_id = run_start.JobId() if run_start.JobId() else b""
     filename = run_start.Filename() if run_start.Filename() else b""
-    nexus_structure = run_start.NexusStructure() if run_start.NexusStructure() else b""
     instrument_name = run_start.InstrumentName() if run_start.InstrumentName() else b""
     run_name = run_start.RunName() if run_start.RunName() else b""
 
-    return RunStartInfo(
+    run_start_info = RunStartInfo(
         job_id.decode(),
         filename.decode(),
         run_start.StartTime(),
         run_start.StopTime(),
         run_name.decode(),
-        nexus_structure.decode(),
+        _NOT_DECODED,
         service_id.decode(),
         instrument_name.decode(),
         broker.decode(),
+        run_start.NPeriods(),
+        _deserialise_detector_spectrum_map(run_start),
     )
+    # The nexus structure is decoded from the table if and when it is accessed
+    run_start_info._run_start = run_start
+    return run_start_info
@@ -1,7 +1,10 @@
 from typing import Optional, Union
-import flatbuffers
 from streaming_data_types.fbschemas.run_stop_6s4t import RunStop
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+)
 from collections import namedtuple
 
 FILE_IDENTIFIER = b"6s4t"
@@ -13,7 +16,7 @@ def serialise_6s4t(
     service_id: str = "",
     stop_time: Optional[int] = None,
 ) -> bytes:
-    builder = flatbuffers.Builder(136)
+    builder = get_builder(136)
 
     if service_id is None:
         service_id = ""
@@ -35,9 +38,7 @@ def serialise_6s4t(
     builder.Finish(run_stop_message)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER)
 
 
 RunStopInfo = namedtuple(
@@ -45,8 +46,11 @@ RunStopInfo = namedtuple(
 )
 
 
-def deserialise_6s4t(buffer: Union[bytearray, bytes]) -> RunStopInfo:
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+def deserialise_6s4t(
+    buffer: Union[bytearray, bytes], check_identifier: bool = True
+) -> RunStopInfo:
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     run_stop = RunStop.RunStop.GetRootAsRunStop(buffer, 0)
     service_id = run_stop.ServiceId() if run_stop.ServiceId() else b""
@@ -1,6 +1,9 @@
 from collections import namedtuple
-import flatbuffers
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+)
 
 from streaming_data_types.fbschemas.status_x5f2 import Status
 
@@ -20,14 +23,16 @@ StatusMessage = namedtuple(
 )
 
 
-def deserialise_x5f2(buffer):
+def deserialise_x5f2(buffer, check_identifier=True):
     """
     Deserialise FlatBuffer x5f2.
 
     :param buffer: The FlatBuffers buffer.
+    :param check_identifier: Whether to check the buffer's schema identifier.
     :return: The deserialised data.
     """
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     log_message = Status.Status.GetRootAsStatus(buffer, 0)
 
@@ -63,7 +68,7 @@ def serialise_x5f2(
     :return:
     """
 
-    builder = flatbuffers.Builder(1024)
+    builder = get_builder(1024)
 
     software_name = builder.CreateString(software_name)
     software_version = builder.CreateString(software_version)
@@ -86,6 +91,4 @@ def serialise_x5f2(
     builder.Finish(data)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER)
@@ -4,14 +4,17 @@ from streaming_data_types.fbschemas.timestamps_tdct.timestamp import (
     timestampAddName,
     timestampAddTimestamps,
     timestampAddSequenceCounter,
-    timestampStartTimestampsVector,
     timestampEnd,
 )
-import flatbuffers
 import numpy as np
 from collections import namedtuple
 from typing import Optional, Union, List
-from streaming_data_types.utils import check_schema_identifier
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    get_builder,
+    output_buffer,
+    serialise_numpy_vector,
+)
 
 FILE_IDENTIFIER = b"tdct"
 
@@ -20,17 +23,14 @@ def serialise_tdct(
     name: str,
     timestamps: Union[np.ndarray, List],
     sequence_counter: Optional[int] = None,
-) -> bytes:
-    builder = flatbuffers.Builder(136)
-
-    timestamps = np.array(timestamps).astype(np.uint64)
+    out: Optional[Union[bytearray, memoryview]] = None,
+    copy: bool = True,
+) -> Union[bytes, memoryview]:
+    builder = get_builder(136)
 
     name_offset = builder.CreateString(name)
 
-    timestampStartTimestampsVector(builder, len(timestamps))
-    for single_value in reversed(timestamps):
-        builder.PrependUint64(single_value)
-    array_offset = builder.EndVector(len(timestamps))
+    array_offset = serialise_numpy_vector(builder, timestamps, np.uint64)
 
     timestampStart(builder)
     timestampAddName(builder, name_offset)
@@ -41,16 +41,17 @@ def serialise_tdct(
     builder.Finish(timestamps_message)
 
     # Generate the output and replace the file_identifier
-    buffer = builder.Output()
-    buffer[4:8] = FILE_IDENTIFIER
-    return bytes(buffer)
+    return output_buffer(builder, FILE_IDENTIFIER, out, copy)
 
 
 Timestamps = namedtuple("Timestamps", ("name", "timestamps", "sequence_counter",),)
 
 
-def deserialise_tdct(buffer: Union[bytearray, bytes]) -> Timestamps:
-    check_schema_identifier(buffer, FILE_IDENTIFIER)
+def deserialise_tdct(
+    buffer: Union[bytearray, bytes], check_identifier: bool = True
+) -> Timestamps:
+    if check_identifier:
+        check_schema_identifier(buffer, FILE_IDENTIFIER)
 
     timestamps = timestamp.GetRootAstimestamp(buffer, 0)
     name = timestamps.Name() if timestamps.Name() else b""
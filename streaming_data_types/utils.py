@@ -1,21 +1,210 @@
-def _get_schema(buffer) -> str:
-    """
-    Extract the schema code embedded in the buffer
+import threading
+from typing import Optional, Union
+import flatbuffers
+from flatbuffers.number_types import UOffsetTFlags
+import numpy as np
+
+
+_builder_pool = threading.local()
 
-    :param buffer: The raw buffer of the FlatBuffers message.
-    :return: The schema identifier
-    """
-    return buffer[4:8].decode("utf-8")
+
+def _has_schema_identifier(buffer, identifier: bytes) -> bool:
+    # Compare the raw bytes in place; bytes and bytearray can do this without
+    # creating a slice, memoryview has no startswith but its slice is only a view
+    if isinstance(buffer, memoryview):
+        return buffer[4:8] == identifier
+    return buffer.startswith(identifier, 4)
 
 
 def check_schema_identifier(buffer, expected_identifer: bytes):
     """
     Check the schema code embedded in the buffer matches an expected identifier
 
-    :param buffer: The raw buffer of the FlatBuffers message
+    Deserialisers call this unless they are passed check_identifier=False, which
+    can be used to skip it when messages have already been routed by identifier.
+
+    :param buffer: The raw buffer of the FlatBuffers message as bytes, bytearray or
+        memoryview
     :param expected_identifer: The expected flatbuffer identifier
     """
-    if _get_schema(buffer) != expected_identifer.decode():
+    if not _has_schema_identifier(buffer, expected_identifer):
         raise RuntimeError(
-            f"Incorrect schema: expected {expected_identifer} but got {_get_schema(buffer)}"
+            f"Incorrect schema: expected {expected_identifer} but got {bytes(buffer[4:8])}"
         )
+
+
+def _check_convertible(array: np.ndarray, vector_type: np.dtype):
+    # The assignment into the vector casts unsafely, so reject what the builder's
+    # per-element Prepend methods would have rejected rather than write wrong values
+    # Empty lists become float64 arrays, but there are no values to convert
+    if not array.size or np.can_cast(array.dtype, vector_type, "safe"):
+        return
+    if vector_type.kind in "iu":
+        if array.dtype.kind not in "iu":
+            raise TypeError(f"Cannot write {array.dtype} data as {vector_type}")
+        limits = np.iinfo(vector_type)
+        if array.min() < limits.min or array.max() > limits.max:
+            raise ValueError(
+                f"Data is out of the range [{limits.min}, {limits.max}] of "
+                f"{vector_type}"
+            )
+    elif not np.can_cast(array.dtype, vector_type, "same_kind"):
+        raise TypeError(f"Cannot write {array.dtype} data as {vector_type}")
+
+
+def serialise_numpy_vector(builder, data, dtype) -> int:
+    """
+    Write array data into the builder as a FlatBuffers vector in one block copy
+
+    The data is converted to little-endian values of the given type as it is copied
+    straight into the builder's memory, which produces the same bytes as prepending
+    the elements one at a time without needing a temporary copy of the array.
+
+    :param builder: The FlatBuffers builder
+    :param data: The data to write, any array-like is flattened in row-major order
+    :param dtype: The numpy type matching the vector's element type in the schema
+    :return: The offset of the vector
+    :raises TypeError: If the data is not of a type that converts to the vector type
+    :raises ValueError: If the data is out of the range of an integer vector type
+    """
+    array = np.asarray(data)
+    vector_type = np.dtype(dtype).newbyteorder("<")
+    _check_convertible(array, vector_type)
+    builder.StartVector(vector_type.itemsize, array.size, vector_type.alignment)
+    builder.head = UOffsetTFlags.py_type(
+        builder.Head() - array.size * vector_type.itemsize
+    )
+    vector = np.frombuffer(builder.Bytes, vector_type, array.size, builder.Head())
+    vector.reshape(array.shape)[...] = array
+    return builder.EndVector(array.size)
+
+
+def serialise_numpy_vector_table(builder, data, dtype, start, add_value, end) -> int:
+    """
+    Write array data into the builder as the vector field of a table
+
+    For the schemas' array tables, such as hs00's ArrayDouble or f142's ArrayInt,
+    which hold a single vector field.
+
+    :param builder: The FlatBuffers builder
+    :param data: The data to write, as for serialise_numpy_vector
+    :param dtype: The numpy type matching the vector's element type in the schema
+    :param start: The generated function that starts the table
+    :param add_value: The generated function that adds the vector to the table
+    :param end: The generated function that ends the table
+    :return: The offset of the table
+    """
+    vector_offset = serialise_numpy_vector(builder, data, dtype)
+    start(builder)
+    add_value(builder, vector_offset)
+    return end(builder)
+
+
+def output_buffer(
+    builder,
+    file_identifier: bytes,
+    out: Optional[Union[bytearray, memoryview]] = None,
+    copy: bool = True,
+) -> Union[bytes, memoryview]:
+    """
+    Get the finished message from the builder with the file identifier set
+
+    By default the message is returned as a new bytes object. If copy is False a
+    memoryview over the builder's own memory is returned instead, which avoids
+    copying the payload. If out is supplied the message is copied into the start of
+    it and a memoryview of the written region is returned.
+
+    :param builder: The FlatBuffers builder, Finish must have been called
+    :param file_identifier: The flatbuffer identifier to write into the message
+    :param out: Optional writable buffer to copy the message into
+    :param copy: Whether to return a copy of the message, ignored if out is supplied
+    :return: The message
+    """
+    message = memoryview(builder.Bytes)[builder.Head() :]
+    message[4:8] = file_identifier
+
+    if out is not None:
+        out = memoryview(out).cast("B")
+        if len(out) < len(message):
+            raise ValueError(
+                f"Output buffer too small: message is {len(message)} bytes but buffer "
+                f"is {len(out)} bytes"
+            )
+        out[: len(message)] = message
+        release_builder(builder)
+        return out[: len(message)]
+
+    if copy:
+        output = bytes(message)
+        release_builder(builder)
+        return output
+
+    # The returned view now owns the builder's memory, so it is not reused
+    return message
+
+
+def _clear_builder(builder: flatbuffers.Builder, size: int):
+    # Reset through __init__ rather than field by field, as the builder's fields
+    # differ between flatbuffers versions, then give it back its memory
+    memory = builder.Bytes
+    flatbuffers.Builder.__init__(builder, 0)
+    builder.Bytes = memory if len(memory) >= size else bytearray(size)
+    builder.head = UOffsetTFlags.py_type(len(builder.Bytes))
+
+
+def _free_builders() -> list:
+    try:
+        return _builder_pool.free
+    except AttributeError:
+        _builder_pool.free = []
+        return _builder_pool.free
+
+
+def get_builder(size_hint: int = 1024) -> flatbuffers.Builder:
+    """
+    Get an empty FlatBuffers builder from the current thread's pool
+
+    Builders keep the memory they have grown to when they are released, so in
+    steady state no reallocation is needed. A new builder is created if the pool
+    is empty.
+
+    :param size_hint: The minimum initial capacity of the builder in bytes
+    :return: The builder
+    """
+    free = _free_builders()
+    if not free:
+        return flatbuffers.Builder(size_hint)
+    builder = free.pop()
+    _clear_builder(builder, size_hint)
+    return builder
+
+
+def release_builder(builder: flatbuffers.Builder):
+    """
+    Return a builder to the current thread's pool so its memory can be reused
+
+    The builder and any views of its memory must not be used after this.
+
+    :param builder: The builder to return
+    """
+    _free_builders().append(builder)
+
+
+def reserve_builder_capacity(size: int):
+    """
+    Make sure the current thread's pooled builder can hold at least size bytes
+
+    Call this before serialising a message whose size is known in advance, e.g.
+    from the number of events, so the builder does not have to grow while the
+    message is being built.
+
+    :param size: The required capacity in bytes
+    """
+    release_builder(get_builder(size))
+
+
+def clear_builder_pool():
+    """
+    Drop the current thread's pooled builders and free their memory
+    """
+    _free_builders().clear()
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from streaming_data_types import deserialise
+from streaming_data_types.eventdata_ev42 import serialise_ev42, EventData
+from streaming_data_types.logdata_f142 import serialise_f142, LogDataInfo
+from streaming_data_types.run_stop_6s4t import serialise_6s4t, RunStopInfo
+
+
+class TestDeserialise:
+    def test_routes_messages_of_different_schemas_to_their_deserialiser(self):
+        events = serialise_ev42("some_source", 123456, 567890, [1, 2, 3], [4, 5, 6])
+        log = serialise_f142(1.234, "some_source", 1585332414000000000)
+        run_stop = serialise_6s4t("some_job", stop_time=578214)
+
+        event_data = deserialise(events)
+        log_data = deserialise(log)
+        run_stop_info = deserialise(run_stop)
+
+        assert isinstance(event_data, EventData)
+        assert np.array_equal(event_data.detector_id, [4, 5, 6])
+        assert isinstance(log_data, LogDataInfo)
+        assert log_data.value == 1.234
+        assert isinstance(run_stop_info, RunStopInfo)
+        assert run_stop_info.job_id == "some_job"
+
+    def test_accepts_bytearray_and_memoryview_buffers(self):
+        log = serialise_f142(42, "some_source")
+
+        assert deserialise(bytearray(log)).value == 42
+        assert deserialise(memoryview(log)).value == 42
+
+    def test_if_schema_is_unsupported_then_throws(self):
+        buf = bytearray(serialise_6s4t("some_job"))
+        buf[4:8] = b"1234"
+
+        with pytest.raises(RuntimeError):
+            deserialise(buf)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from streaming_data_types.detector_mapping import DetectorMapping, UNMAPPED
+from streaming_data_types.event_histogrammer import EventHistogrammer
+from streaming_data_types.eventdata_ev42 import EventDataView, serialise_ev42
+from streaming_data_types.run_start_pl72 import DetectorSpectrumMap, serialise_pl72
+
+
+class TestDetectorMapping:
+    detector_ids = [10, 11, 12, 20]
+    spectra = [1, 2, 3, 4]
+
+    def test_dense_mapping_maps_ids_and_marks_unknown_ids_unmapped(self):
+        mapping = DetectorMapping(self.detector_ids, self.spectra)
+
+        mapped = mapping.map(np.array([11, 20, 0, 15, 10, 4000000000], np.uint32))
+
+        assert mapping.is_dense
+        assert np.array_equal(mapped, [2, 4, UNMAPPED, UNMAPPED, 1, UNMAPPED])
+
+    def test_sparse_mapping_gives_same_result_as_dense_mapping(self):
+        dense = DetectorMapping(self.detector_ids, self.spectra)
+        sparse = DetectorMapping(self.detector_ids, self.spectra, max_dense_size=4)
+        detector_id = np.arange(0, 30, dtype=np.uint32)
+
+        assert not sparse.is_dense
+        assert np.array_equal(sparse.map(detector_id), dense.map(detector_id))
+
+    def test_mapping_can_be_created_from_dict(self):
+        mapping = DetectorMapping.from_dict({5: 50, 1: 10})
+
+        assert np.array_equal(mapping.map([1, 5, 3]), [10, 50, UNMAPPED])
+
+    def test_mapping_can_be_loaded_from_pl72_spectrum_map(self):
+        buf = serialise_pl72(
+            "some_job",
+            "some_file.nxs",
+            detector_spectrum_map=DetectorSpectrumMap(
+                self.spectra, self.detector_ids, len(self.spectra)
+            ),
+        )
+
+        mapping = DetectorMapping.from_pl72(buf)
+
+        assert len(mapping) == 4
+        assert np.array_equal(mapping.map(self.detector_ids), self.spectra)
+
+    def test_if_pl72_has_no_spectrum_map_then_throws(self):
+        with pytest.raises(ValueError):
+            DetectorMapping.from_pl72(serialise_pl72("some_job", "some_file.nxs"))
+
+    def test_event_data_detector_ids_are_mapped(self):
+        mapping = DetectorMapping(self.detector_ids, self.spectra)
+        buf = serialise_ev42("some_source", 1, 100, [5, 6, 7], [12, 10, 13])
+
+        event_data = mapping.map_event_data(EventDataView(buf))
+
+        assert np.array_equal(event_data.time_of_flight, [5, 6, 7])
+        assert np.array_equal(event_data.detector_id, [3, 1, UNMAPPED])
+
+    def test_histogrammer_bins_mapped_detector_ids(self):
+        mapping = DetectorMapping(self.detector_ids, self.spectra)
+        histogrammer = EventHistogrammer(
+            [0, 100], np.arange(1, 6), detector_mapping=mapping
+        )
+
+        histogrammer.add_events([5, 6, 7, 8], [12, 10, 13, 12])
+
+        assert np.array_equal(histogrammer.counts, [[1, 0, 2, 0]])
+
+    def test_if_detector_ids_are_repeated_then_throws(self):
+        with pytest.raises(ValueError):
+            DetectorMapping([1, 2, 1], [1, 2, 3])
+
+    def test_if_lengths_differ_then_throws(self):
+        with pytest.raises(ValueError):
+            DetectorMapping([1, 2], [1])
@@ -1,6 +1,16 @@
+import copy
+import pickle
 import numpy as np
 import pytest
-from streaming_data_types.eventdata_ev42 import serialise_ev42, deserialise_ev42
+from streaming_data_types.eventdata_ev42 import (
+    serialise_ev42,
+    deserialise_ev42,
+    deserialise_ev42_batch,
+    EventDataView,
+    split_ev42,
+    merge_ev42,
+)
+from streaming_data_types.utils import get_builder, release_builder
 from streaming_data_types import SERIALISERS, DESERIALISERS
 
 
@@ -47,6 +57,28 @@ class TestSerialisationEv42:
         assert np.array_equal(entry.time_of_flight, original_entry["time_of_flight"])
         assert np.array_equal(entry.detector_id, original_entry["detector_id"])
 
+    def test_serialises_and_deserialises_ev42_message_correctly_for_non_int32_arrays(
+        self,
+    ):
+        """
+        Round-trip to check arrays of other types and byte orders are converted.
+        """
+        original_entry = {
+            "source_name": "some_source",
+            "message_id": 123456,
+            "pulse_time": 567890,
+            "time_of_flight": np.arange(100000, dtype=">i8"),
+            "detector_id": np.arange(100000, dtype=np.int64)[::-1],
+        }
+
+        buf = serialise_ev42(**original_entry)
+        entry = deserialise_ev42(buf)
+
+        assert entry.time_of_flight.dtype == np.uint32
+        assert entry.detector_id.dtype == np.uint32
+        assert np.array_equal(entry.time_of_flight, original_entry["time_of_flight"])
+        assert np.array_equal(entry.detector_id, original_entry["detector_id"])
+
     def test_serialises_and_deserialises_ev42_message_correctly_with_isis_info(self):
         """
         Round-trip to check what we serialise is what we get back.
@@ -76,6 +108,63 @@ class TestSerialisationEv42:
             isis_data["proton_charge"]
         )
 
+    def test_serialises_ev42_message_as_memoryview_when_copy_is_false(self):
+        original_entry = {
+            "source_name": "some_source",
+            "message_id": 123456,
+            "pulse_time": 567890,
+            "time_of_flight": [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            "detector_id": [10, 20, 30, 40, 50, 60, 70, 80, 90],
+        }
+
+        buf = serialise_ev42(**original_entry, copy=False)
+        entry = deserialise_ev42(buf)
+
+        assert isinstance(buf, memoryview)
+        assert bytes(buf) == serialise_ev42(**original_entry)
+        assert entry.source_name == original_entry["source_name"]
+        assert np.array_equal(entry.time_of_flight, original_entry["time_of_flight"])
+
+    def test_serialises_ev42_message_into_supplied_buffer(self):
+        original_entry = {
+            "source_name": "some_source",
+            "message_id": 123456,
+            "pulse_time": 567890,
+            "time_of_flight": [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            "detector_id": [10, 20, 30, 40, 50, 60, 70, 80, 90],
+        }
+        out = bytearray(1024)
+
+        buf = serialise_ev42(**original_entry, out=out)
+        entry = deserialise_ev42(out)
+
+        assert bytes(buf) == serialise_ev42(**original_entry)
+        assert out[: len(buf)] == buf
+        assert entry.message_id == original_entry["message_id"]
+        assert np.array_equal(entry.detector_id, original_entry["detector_id"])
+
+    def test_if_supplied_buffer_is_too_small_then_throws(self):
+        original_entry = {
+            "source_name": "some_source",
+            "message_id": 123456,
+            "pulse_time": 567890,
+            "time_of_flight": [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            "detector_id": [10, 20, 30, 40, 50, 60, 70, 80, 90],
+        }
+
+        with pytest.raises(ValueError):
+            serialise_ev42(**original_entry, out=bytearray(16))
+
+    def test_if_event_data_does_not_fit_the_vector_type_then_throws(self):
+        with pytest.raises(ValueError):
+            serialise_ev42("some_source", 1, 100, [2**33], [1])
+        with pytest.raises(ValueError):
+            serialise_ev42("some_source", 1, 100, [1], [-1])
+        with pytest.raises(TypeError):
+            serialise_ev42("some_source", 1, 100, [1.7], [1])
+        with pytest.raises(TypeError):
+            serialise_ev42("some_source", 1, 100, [1], ["5"])
+
     def test_if_buffer_has_wrong_id_then_throws(self):
         original_entry = {
             "source_name": "some_source",
@@ -93,6 +182,166 @@ class TestSerialisationEv42:
         with pytest.raises(RuntimeError):
             deserialise_ev42(buf)
 
+    def test_event_data_view_has_same_values_as_deserialised_event_data(self):
+        isis_data = {"period_number": 5, "run_state": 1, "proton_charge": 1.234}
+        original_entry = {
+            "source_name": "some_source",
+            "message_id": 123456,
+            "pulse_time": 567890,
+            "time_of_flight": [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            "detector_id": [10, 20, 30, 40, 50, 60, 70, 80, 90],
+            "isis_specific": isis_data,
+        }
+        buf = serialise_ev42(**original_entry)
+
+        entry = deserialise_ev42(buf)
+        view = EventDataView(buf)
+
+        assert view.source_name == entry.source_name
+        assert view.message_id == entry.message_id
+        assert view.pulse_time == entry.pulse_time
+        assert np.array_equal(view.time_of_flight, entry.time_of_flight)
+        assert np.array_equal(view.detector_id, entry.detector_id)
+        assert view.specific_data == entry.specific_data
+        assert view.to_event_data().source_name == entry.source_name
+
+    def test_event_data_view_caches_decoded_fields(self):
+        buf = serialise_ev42("some_source", 123456, 567890, [1, 2, 3], [4, 5, 6])
+
+        view = EventDataView(buf)
+
+        assert view.time_of_flight is view.time_of_flight
+        assert view.specific_data is None
+        with pytest.raises(AttributeError):
+            view.time_of_flight = [7, 8, 9]
+
+    def test_event_data_view_survives_pickle_and_deepcopy(self):
+        buf = memoryview(
+            serialise_ev42("some_source", 123456, 567890, [1, 2, 3], [4, 5, 6])
+        )
+        view = EventDataView(buf)
+        view.message_id
+
+        for duplicate in (lambda v: pickle.loads(pickle.dumps(v)), copy.deepcopy):
+            copied = duplicate(view)
+
+            assert copied.source_name == "some_source"
+            assert copied.message_id == 123456
+            assert copied.pulse_time == 567890
+            assert np.array_equal(copied.time_of_flight, [1, 2, 3])
+            assert np.array_equal(copied.detector_id, [4, 5, 6])
+
+    def test_if_buffer_has_wrong_id_then_event_data_view_throws(self):
+        buf = bytearray(serialise_ev42("some_source", 1, 2, [1, 2, 3], [4, 5, 6]))
+        buf[4:8] = b"1234"
+
+        with pytest.raises(RuntimeError):
+            EventDataView(buf)
+
+    def test_batch_deserialise_concatenates_events_of_all_messages(self):
+        buffers = [
+            serialise_ev42("some_source", 1, 100, [1, 2, 3], [10, 20, 30]),
+            serialise_ev42("some_source", 2, 200, [], []),
+            bytearray(
+                serialise_ev42(
+                    "some_source",
+                    3,
+                    300,
+                    [4, 5],
+                    [40, 50],
+                    {"period_number": 5, "run_state": 1, "proton_charge": 1.234},
+                )
+            ),
+        ]
+
+        batch = deserialise_ev42_batch(buffers)
+
+        assert np.array_equal(batch.message_id, [1, 2, 3])
+        assert np.array_equal(batch.pulse_time, [100, 200, 300])
+        assert np.array_equal(batch.event_offsets, [0, 3, 3, 5])
+        assert np.array_equal(batch.time_of_flight, [1, 2, 3, 4, 5])
+        assert np.array_equal(batch.detector_id, [10, 20, 30, 40, 50])
+        assert batch.time_of_flight.dtype == np.uint32
+
+    def test_batch_deserialise_of_no_messages_returns_empty_arrays(self):
+        batch = deserialise_ev42_batch([])
+
+        assert len(batch.message_id) == 0
+        assert np.array_equal(batch.event_offsets, [0])
+        assert len(batch.time_of_flight) == 0
+
+    def test_if_any_buffer_in_batch_has_wrong_id_then_throws(self):
+        bad_buffer = bytearray(serialise_ev42("some_source", 2, 200, [1], [2]))
+        bad_buffer[4:8] = b"1234"
+        buffers = [serialise_ev42("some_source", 1, 100, [1], [2]), bad_buffer]
+
+        with pytest.raises(RuntimeError):
+            deserialise_ev42_batch(buffers)
+
+    def test_split_messages_are_within_size_limit_and_merge_back(self):
+        isis_data = {"period_number": 5, "run_state": 1, "proton_charge": 1.5}
+        time_of_flight = np.arange(10000, dtype=np.uint32)
+        detector_id = np.arange(10000, 20000, dtype=np.uint32)
+        buf = serialise_ev42(
+            "some_source", 123, 456, time_of_flight, detector_id, isis_data
+        )
+
+        parts = split_ev42(buf, 10000)
+
+        assert len(parts) > 1
+        assert all(len(part) <= 10000 for part in parts)
+        for part in parts:
+            event = deserialise_ev42(part)
+            assert event.message_id == 123
+            assert event.pulse_time == 456
+            assert event.specific_data == isis_data
+        merged = deserialise_ev42(merge_ev42(parts))
+        assert merged.source_name == "some_source"
+        assert merged.message_id == 123
+        assert merged.pulse_time == 456
+        assert merged.specific_data == isis_data
+        assert np.array_equal(merged.time_of_flight, time_of_flight)
+        assert np.array_equal(merged.detector_id, detector_id)
+
+    def test_split_returns_the_pooled_builder_to_the_pool(self):
+        events = np.arange(10000, dtype=np.uint32)
+        buf = serialise_ev42("some_source", 1, 100, events, events)
+        builder = get_builder()
+        release_builder(builder)
+
+        split_ev42(buf, 10000)
+
+        assert get_builder() is builder
+
+    def test_split_returns_message_unchanged_if_within_size_limit(self):
+        buf = serialise_ev42("some_source", 1, 100, [1, 2], [3, 4])
+
+        assert split_ev42(buf, len(buf)) == [buf]
+
+    def test_if_split_size_is_too_small_for_any_events_then_throws(self):
+        buf = serialise_ev42("some_source", 1, 100, [1, 2], [3, 4])
+
+        with pytest.raises(ValueError):
+            split_ev42(buf, 40)
+
+    def test_if_merged_messages_have_different_pulse_times_then_throws(self):
+        buffers = [
+            serialise_ev42("some_source", 1, 100, [1], [2]),
+            serialise_ev42("some_source", 2, 200, [3], [4]),
+        ]
+
+        with pytest.raises(ValueError):
+            merge_ev42(buffers)
+
+    def test_if_merged_messages_have_different_sources_then_throws(self):
+        buffers = [
+            serialise_ev42("some_source", 1, 100, [1], [2]),
+            serialise_ev42("other_source", 2, 100, [3], [4]),
+        ]
+
+        with pytest.raises(ValueError):
+            merge_ev42(buffers)
+
     def test_schema_type_is_in_global_serialisers_list(self):
         assert "ev42" in SERIALISERS
         assert "ev42" in DESERIALISERS
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from streaming_data_types.event_filter import EventFilter
+from streaming_data_types.eventdata_ev42 import deserialise_ev42, serialise_ev42
+
+
+class TestEventFilter:
+    time_of_flight = np.array([5, 10, 15, 20, 25, 30], dtype=np.uint32)
+    detector_id = np.array([1, 2, 3, 4, 100, 2], dtype=np.uint32)
+
+    def test_events_outside_tof_window_are_dropped(self):
+        event_filter = EventFilter(tof_min=10, tof_max=25)
+
+        mask = event_filter.mask(self.time_of_flight, self.detector_id)
+
+        assert np.array_equal(mask, [False, True, True, True, False, False])
+
+    def test_only_selected_detectors_are_kept(self):
+        event_filter = EventFilter(detector_ids=[2, 4])
+
+        mask = event_filter.mask(self.time_of_flight, self.detector_id)
+
+        assert np.array_equal(mask, [False, True, False, True, False, True])
+
+    def test_detector_and_tof_selections_are_combined(self):
+        event_filter = EventFilter(tof_max=30, detector_ids=[2, 4, 100])
+
+        mask = event_filter.mask(self.time_of_flight, self.detector_id)
+
+        assert np.array_equal(mask, [False, True, False, True, True, False])
+
+    def test_filtered_message_round_trips_through_ev42(self):
+        event_filter = EventFilter(tof_min=10, detector_ids=[2, 3])
+        isis_data = {"period_number": 5, "run_state": 1, "proton_charge": 1.5}
+        buffer = serialise_ev42(
+            "some_source", 123, 456, self.time_of_flight, self.detector_id, isis_data
+        )
+
+        filtered = deserialise_ev42(event_filter.filter_ev42(buffer))
+
+        assert filtered.source_name == "some_source"
+        assert filtered.message_id == 123
+        assert filtered.pulse_time == 456
+        assert np.array_equal(filtered.time_of_flight, [10, 15, 30])
+        assert np.array_equal(filtered.detector_id, [2, 3, 2])
+        assert filtered.specific_data == isis_data
+
+    def test_messages_outside_pulse_time_range_are_dropped(self):
+        event_filter = EventFilter(pulse_time_min=100, pulse_time_max=200)
+
+        def filter_pulse(pulse_time):
+            return event_filter.filter_ev42(
+                serialise_ev42(
+                    "some_source", 1, pulse_time, self.time_of_flight, self.detector_id
+                )
+            )
+
+        assert filter_pulse(99) is None
+        assert filter_pulse(100) is not None
+        assert filter_pulse(200) is None
+
+    def test_if_detector_ids_are_negative_then_throws(self):
+        with pytest.raises(ValueError):
+            EventFilter(detector_ids=[-1, 2])
+
+    def test_large_detector_ids_are_selected_without_a_dense_table(self):
+        event_filter = EventFilter(detector_ids=[2, 4_000_000_000])
+        detector_id = np.array([2, 3, 4_000_000_000, 4_000_000_001], dtype=np.uint32)
+
+        mask = event_filter.mask(np.zeros(4, dtype=np.uint32), detector_id)
+
+        assert event_filter._detector_table is None
+        assert np.array_equal(mask, [True, False, True, False])
+
+    def test_negative_detector_ids_are_never_selected(self):
+        for max_dense_size in (1 << 24, 1):
+            event_filter = EventFilter(
+                detector_ids=[0, 2], max_dense_size=max_dense_size
+            )
+
+            mask = event_filter.mask(np.zeros(4), np.array([-1, -3, 0, 2]))
+
+            assert np.array_equal(mask, [False, False, True, True])
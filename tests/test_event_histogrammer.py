@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+from streaming_data_types.event_histogrammer import EventHistogrammer
+from streaming_data_types.eventdata_ev42 import serialise_ev42, deserialise_ev42
+from streaming_data_types.histogram_hs00 import deserialise_hs00
+
+
+def _expected_counts(time_of_flight, detector_id, tof_edges, detector_edges):
+    # Drop events on the last edges as np.histogram2d includes them in the last bin
+    in_range = (time_of_flight < tof_edges[-1]) & (detector_id < detector_edges[-1])
+    counts, _, _ = np.histogram2d(
+        time_of_flight[in_range], detector_id[in_range], (tof_edges, detector_edges)
+    )
+    return counts
+
+
+class TestEventHistogrammer:
+    tof_edges = np.linspace(0, 1000, 11)
+    detector_edges = np.arange(0, 65)
+
+    def _random_events(self, number_of_events, seed=0):
+        rng = np.random.default_rng(seed)
+        time_of_flight = rng.integers(0, 1100, number_of_events).astype(np.uint32)
+        detector_id = rng.integers(0, 70, number_of_events).astype(np.uint32)
+        return time_of_flight, detector_id
+
+    def test_counts_match_numpy_histogram(self):
+        histogrammer = EventHistogrammer(self.tof_edges, self.detector_edges)
+        time_of_flight, detector_id = self._random_events(100000)
+
+        histogrammer.add_events(time_of_flight, detector_id)
+
+        assert np.array_equal(
+            histogrammer.counts,
+            _expected_counts(
+                time_of_flight, detector_id, self.tof_edges, self.detector_edges
+            ),
+        )
+
+    def test_counts_match_numpy_histogram_for_few_events_and_uneven_bins(self):
+        tof_edges = [0, 10, 50, 200, 1000]
+        histogrammer = EventHistogrammer(tof_edges, self.detector_edges)
+        time_of_flight, detector_id = self._random_events(10)
+
+        histogrammer.add_events(time_of_flight, detector_id)
+
+        assert np.array_equal(
+            histogrammer.counts,
+            _expected_counts(
+                time_of_flight, detector_id, tof_edges, self.detector_edges
+            ),
+        )
+
+    def test_counts_match_numpy_histogram_for_bins_close_to_equal_width(self):
+        nearly_equal_widths = np.concatenate(
+            (np.ones(100000), np.full(100000, 1 + 9e-6))
+        )
+        for tof_edges in (
+            np.array([0, 1, 9, 10, 11, 12]) * 1e-9,
+            np.concatenate(([0], np.cumsum(nearly_equal_widths))),
+        ):
+            histogrammer = EventHistogrammer(tof_edges, [0, 1])
+            # Bin centres and lower edges, which are included in their bin
+            time_of_flight = np.concatenate(
+                ((tof_edges[:-1] + tof_edges[1:]) / 2, tof_edges[:-1])
+            )
+            detector_id = np.zeros(len(time_of_flight), dtype=np.uint32)
+
+            histogrammer.add_events(time_of_flight, detector_id)
+
+            assert np.array_equal(
+                histogrammer.counts,
+                _expected_counts(time_of_flight, detector_id, tof_edges, [0, 1]),
+            )
+
+    def test_events_from_ev42_messages_are_accumulated(self):
+        histogrammer = EventHistogrammer(self.tof_edges, self.detector_edges)
+        first_events = self._random_events(1000, seed=1)
+        second_events = self._random_events(1000, seed=2)
+
+        histogrammer.add_ev42(serialise_ev42("some_source", 1, 100, *first_events))
+        histogrammer.add_event_data(
+            deserialise_ev42(serialise_ev42("some_source", 2, 200, *second_events))
+        )
+
+        expected = _expected_counts(
+            *first_events, self.tof_edges, self.detector_edges
+        ) + _expected_counts(*second_events, self.tof_edges, self.detector_edges)
+        assert np.array_equal(histogrammer.counts, expected)
+        assert histogrammer.last_pulse_time == 200
+
+    def test_reset_sets_counts_to_zero(self):
+        histogrammer = EventHistogrammer(self.tof_edges, self.detector_edges)
+        histogrammer.add_events(*self._random_events(1000))
+
+        histogrammer.reset()
+
+        assert not histogrammer.counts.any()
+
+    def test_serialised_histogram_round_trips_through_hs00(self):
+        histogrammer = EventHistogrammer(
+            self.tof_edges, self.detector_edges, source="some_source"
+        )
+        histogrammer.add_ev42(
+            serialise_ev42("some_source", 1, 100, *self._random_events(1000))
+        )
+
+        hist = deserialise_hs00(histogrammer.serialise())
+
+        assert hist["source"] == "some_source"
+        assert hist["timestamp"] == 100
+        assert hist["current_shape"] == [10, 64]
+        assert hist["data"].dtype == np.uint64
+        assert np.array_equal(hist["data"], histogrammer.counts)
+        assert np.array_equal(hist["dim_metadata"][0]["bin_boundaries"], self.tof_edges)
+        assert np.array_equal(
+            hist["dim_metadata"][1]["bin_boundaries"], self.detector_edges
+        )
+
+    def test_publish_is_rate_limited(self):
+        histogrammer = EventHistogrammer(
+            self.tof_edges, self.detector_edges, publish_interval_s=1.0
+        )
+
+        assert histogrammer.publish(now=10.0) is not None
+        assert histogrammer.publish(now=10.5) is None
+        assert histogrammer.publish(now=11.0) is not None
+
+    def test_if_bin_edges_are_not_increasing_then_throws(self):
+        with pytest.raises(ValueError):
+            EventHistogrammer([0, 10, 5], self.detector_edges)
@@ -1,6 +1,12 @@
 import pytest
 import numpy as np
-from streaming_data_types.logdata_f142 import serialise_f142, deserialise_f142
+from streaming_data_types.logdata_f142 import (
+    serialise_f142,
+    deserialise_f142,
+    F142ScalarEncoder,
+    serialise_f142_batch,
+    deserialise_f142_batch,
+)
 from streaming_data_types.fbschemas.logdata_f142.AlarmSeverity import AlarmSeverity
 from streaming_data_types.fbschemas.logdata_f142.AlarmStatus import AlarmStatus
 from streaming_data_types import SERIALISERS, DESERIALISERS
@@ -104,6 +110,30 @@ class TestSerialisationf142:
         assert np.array_equal(deserialised_tuple.value, array_log["value"])
         assert deserialised_tuple.value.dtype == array_log["value"].dtype
 
+    def test_serialises_and_deserialises_numpy_arrays_of_all_numeric_types_correctly(
+        self,
+    ):
+        for dtype in (
+            np.int16,
+            np.uint16,
+            np.int32,
+            np.uint32,
+            np.int64,
+            np.uint64,
+            np.float32,
+            np.float64,
+        ):
+            array_log = {
+                "source_name": "some_source",
+                "value": np.arange(100000).astype(dtype),
+                "timestamp_unix_ns": 1585332414000000000,
+            }
+            buf = serialise_f142(**array_log)
+            deserialised_tuple = deserialise_f142(buf)
+
+            assert np.array_equal(deserialised_tuple.value, array_log["value"])
+            assert deserialised_tuple.value.dtype == array_log["value"].dtype
+
     def test_serialises_and_deserialises_numpy_array_floats_correctly(self):
         array_log = {
             "source_name": "some_source",
@@ -167,6 +197,210 @@ class TestSerialisationf142:
         with pytest.raises(NotImplementedError):
             serialise_f142(**complex_log)
 
+    def test_scalar_values_are_serialised_like_the_equivalent_numpy_array(self):
+        for value in (1.5, 7, -7, 2**63, np.float32(1.5), np.int16(-3), np.uint64(5)):
+            deserialised_tuple = deserialise_f142(serialise_f142(value, "some_source"))
+            # 0-d arrays are serialised with a FlatBuffers builder
+            expected = deserialise_f142(serialise_f142(np.array(value), "some_source"))
+
+            assert deserialised_tuple.value == expected.value
+            assert deserialised_tuple.value.dtype == expected.value.dtype
+
+    def test_scalar_values_are_serialised_to_the_same_bytes_as_numpy_arrays(self):
+        for alarms in ((), (AlarmStatus.HIHI, AlarmSeverity.MAJOR)):
+            buf = serialise_f142(1.5, "some_source", 5, *alarms)
+
+            # The alarm fields are only present if alarms are given
+            assert buf == serialise_f142(np.array(1.5), "some_source", 5, *alarms)
+
+    def test_scalar_values_equal_to_defaults_deserialise_like_numpy_arrays(self):
+        for value, timestamp, alarms in (
+            (0.0, 5, ()),
+            (1.5, 0, ()),
+            (1.5, 5, (AlarmStatus.HIHI,)),
+        ):
+            buf = serialise_f142(value, "some_source", timestamp, *alarms)
+            builder_buf = serialise_f142(
+                np.array(value), "some_source", timestamp, *alarms
+            )
+
+            # The builder leaves out fields equal to their defaults, the template
+            # always has them
+            assert buf != builder_buf
+            deserialised_tuple = deserialise_f142(buf)
+            expected = deserialise_f142(builder_buf)
+            assert deserialised_tuple.value == expected.value
+            assert deserialised_tuple[1:] == expected[1:]
+
+    def test_scalar_value_is_serialised_as_memoryview_when_copy_is_false(self):
+        buf = serialise_f142(1.234, "some_source", 5, copy=False)
+
+        assert isinstance(buf, memoryview)
+        assert deserialise_f142(buf).value == 1.234
+
+    def test_scalar_encoder_messages_deserialise_like_serialise_f142_messages(self):
+        for dtype in (np.int8, np.uint16, np.int32, np.uint64, np.float32, np.float64):
+            encoder = F142ScalarEncoder("some_source", dtype)
+            buf = encoder.encode(
+                dtype(42), 1585332414000000000, AlarmStatus.HIHI, AlarmSeverity.MAJOR
+            )
+            expected = deserialise_f142(
+                serialise_f142(
+                    np.array(42, dtype=dtype),
+                    "some_source",
+                    1585332414000000000,
+                    AlarmStatus.HIHI,
+                    AlarmSeverity.MAJOR,
+                )
+            )
+            deserialised_tuple = deserialise_f142(buf)
+
+            assert deserialised_tuple.value == expected.value
+            assert deserialised_tuple.value.dtype == expected.value.dtype
+            assert deserialised_tuple[1:] == expected[1:]
+
+    def test_scalar_encoder_alarms_default_to_no_change_when_not_provided(self):
+        encoder = F142ScalarEncoder("some_source")
+        encoder.encode(1.0, 1, AlarmStatus.HIHI, AlarmSeverity.MAJOR)
+
+        deserialised_tuple = deserialise_f142(encoder.encode(2.0, 2))
+
+        assert deserialised_tuple.value == 2.0
+        assert deserialised_tuple.timestamp_unix_ns == 2
+        assert deserialised_tuple.alarm_status == AlarmStatus.NO_CHANGE
+        assert deserialised_tuple.alarm_severity == AlarmSeverity.NO_CHANGE
+
+    def test_scalar_encoder_encodes_values_equal_to_the_schema_defaults(self):
+        encoder = F142ScalarEncoder("some_source", np.int32)
+
+        deserialised_tuple = deserialise_f142(
+            encoder.encode(0, 0, AlarmStatus.NO_CHANGE, AlarmSeverity.NO_CHANGE)
+        )
+
+        assert deserialised_tuple.value == 0
+        assert deserialised_tuple.timestamp_unix_ns == 0
+        assert deserialised_tuple.alarm_status == AlarmStatus.NO_CHANGE
+        assert deserialised_tuple.alarm_severity == AlarmSeverity.NO_CHANGE
+
+    def test_scalar_encoder_encodes_into_supplied_buffer(self):
+        encoder = F142ScalarEncoder("some_source")
+        out = bytearray(1024)
+
+        buf = encoder.encode(1.234, 5, out=out)
+
+        assert isinstance(buf, memoryview)
+        assert deserialise_f142(buf).value == 1.234
+
+    def test_scalar_encoder_raises_not_implemented_error_for_strings(self):
+        with pytest.raises(NotImplementedError):
+            F142ScalarEncoder("some_source", np.unicode_)
+
+    def test_batch_serialises_each_value_with_its_source_and_timestamp(self):
+        source_names = ["source_a", "source_bb", "source_a", "source_cccccccccc"]
+        values = np.array([1.5, 2.5, 3.5, 4.5])
+        timestamps = np.array([10, 20, 30, 40], dtype=np.uint64)
+        statuses = np.array([AlarmStatus.HIHI] * 4)
+        severities = np.array([AlarmSeverity.MAJOR] * 4)
+
+        messages = serialise_f142_batch(
+            source_names, values, timestamps, statuses, severities
+        )
+
+        assert len(messages) == 4
+        for i, buf in enumerate(messages):
+            deserialised_tuple = deserialise_f142(buf)
+            assert deserialised_tuple.value == values[i]
+            assert deserialised_tuple.source_name == source_names[i]
+            assert deserialised_tuple.timestamp_unix_ns == timestamps[i]
+            assert deserialised_tuple.alarm_status == AlarmStatus.HIHI
+            assert deserialised_tuple.alarm_severity == AlarmSeverity.MAJOR
+
+    def test_batch_messages_match_serialise_f142_messages(self):
+        messages = serialise_f142_batch(["source_a", "source_bb"], [1.5, 2.5], 5)
+
+        assert messages == [
+            serialise_f142(1.5, "source_a", 5),
+            serialise_f142(2.5, "source_bb", 5),
+        ]
+
+    def test_batch_serialises_values_of_types_widened_in_the_schema(self):
+        for dtype in (np.int8, np.uint8):
+            info = np.iinfo(dtype)
+            values = np.array([info.min, -1 if info.min else 1, info.max], dtype)
+
+            messages = serialise_f142_batch("some_source", values)
+
+            assert [deserialise_f142(buf).value for buf in messages] == [
+                deserialise_f142(serialise_f142(value, "some_source")).value
+                for value in values
+            ]
+            assert [deserialise_f142(buf).value for buf in messages] == list(values)
+
+    def test_batch_packed_messages_match_listed_messages(self):
+        source_names = ["source_a", "source_bb", "source_a", "source_cccccccccc"]
+        values = np.arange(4, dtype=np.int32)
+
+        messages = serialise_f142_batch(source_names, values, 5)
+        packed = serialise_f142_batch(source_names, values, 5, packed=True)
+
+        for i, buf in enumerate(messages):
+            assert packed.buffer[packed.offsets[i] : packed.offsets[i + 1]] == buf
+            assert deserialise_f142(buf).value.dtype == np.int64
+
+    def test_batch_with_single_source_name_uses_it_for_all_messages(self):
+        messages = serialise_f142_batch("some_source", [1.0, 2.0], [1, 2])
+
+        deserialised = [deserialise_f142(buf) for buf in messages]
+        assert [log.source_name for log in deserialised] == ["some_source"] * 2
+        assert [log.alarm_status for log in deserialised] == [AlarmStatus.NO_CHANGE] * 2
+
+    def test_batch_of_no_values_is_empty(self):
+        assert serialise_f142_batch([], np.array([], dtype=np.float64)) == []
+
+    def test_if_batch_source_names_and_values_differ_in_length_then_throws(self):
+        with pytest.raises(ValueError):
+            serialise_f142_batch(["source_a"], [1.0, 2.0])
+
+    def test_if_batch_values_are_strings_then_throws(self):
+        with pytest.raises(NotImplementedError):
+            serialise_f142_batch("some_source", ["a", "b"])
+
+    def test_batch_deserialise_gives_same_values_as_deserialise(self):
+        buffers = serialise_f142_batch(
+            ["source_a", "source_b", "source_a"], [1.5, 2.5, 3.5], [10, 20, 30]
+        ) + [
+            serialise_f142(
+                np.int16(-7), "source_c", 40, AlarmStatus.HIHI, AlarmSeverity.MAJOR
+            ),
+            serialise_f142(np.array(8, dtype=np.uint32), "source_b", 50),
+        ]
+
+        batch = deserialise_f142_batch(buffers)
+
+        assert batch.value.dtype == np.float64
+        assert batch.source_names == ["source_a", "source_b", "source_c"]
+        assert np.array_equal(batch.source_index, [0, 1, 0, 2, 1])
+        for i, buf in enumerate(buffers):
+            deserialised_tuple = deserialise_f142(buf)
+            assert batch.value[i] == deserialised_tuple.value
+            assert batch.timestamp_unix_ns[i] == deserialised_tuple.timestamp_unix_ns
+            assert batch.alarm_status[i] == deserialised_tuple.alarm_status
+            assert batch.alarm_severity[i] == deserialised_tuple.alarm_severity
+
+    def test_batch_deserialise_converts_values_to_requested_type(self):
+        buffers = serialise_f142_batch("some_source", np.array([2**40, 3]))
+
+        batch = deserialise_f142_batch(buffers, value_dtype=np.int64)
+
+        assert batch.value.dtype == np.int64
+        assert np.array_equal(batch.value, [2**40, 3])
+
+    def test_if_batch_has_non_scalar_value_then_throws(self):
+        buffers = [serialise_f142("a string", "some_source")]
+
+        with pytest.raises(ValueError):
+            deserialise_f142_batch(buffers)
+
     def test_if_buffer_has_wrong_id_then_throws(self):
         buf = serialise_f142(**self.original_entry)
 
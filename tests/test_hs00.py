@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from streaming_data_types.histogram_hs00 import serialise_hs00, deserialise_hs00
+from streaming_data_types.utils import clear_builder_pool, get_builder
 from streaming_data_types import SERIALISERS, DESERIALISERS
 
 
@@ -358,6 +359,68 @@ class TestSerialisationHs00:
             hist["last_metadata_timestamp"] == original_hist["last_metadata_timestamp"]
         )
 
+    def test_serialises_and_deserialises_hs00_message_correctly_for_non_contiguous_data(
+        self,
+    ):
+        """
+        Round-trip to check transposed arrays are written in row-major order.
+        """
+        data = np.arange(2048 * 1024, dtype=np.uint32).reshape(1024, 2048).T
+        original_hist = {
+            "timestamp": 123456,
+            "current_shape": [2048, 1024],
+            "dim_metadata": [
+                {"length": 2048, "bin_boundaries": np.arange(2049, dtype=np.float32)},
+                {"length": 1024, "bin_boundaries": np.arange(1025, dtype=np.float32)},
+            ],
+            "data": data,
+            "errors": data,
+        }
+        buf = serialise_hs00(original_hist)
+
+        hist = deserialise_hs00(buf)
+        assert hist["current_shape"] == original_hist["current_shape"]
+        assert np.array_equal(hist["data"], original_hist["data"])
+        assert np.array_equal(hist["errors"], original_hist["errors"])
+        assert hist["data"].dtype == np.uint32
+        for dim, original_dim in zip(
+            hist["dim_metadata"], original_hist["dim_metadata"]
+        ):
+            assert np.array_equal(dim["bin_boundaries"], original_dim["bin_boundaries"])
+
+    def test_serialises_hs00_message_as_memoryview_when_copy_is_false(self):
+        original_hist = create_test_data_with_type(np.float64)
+
+        buf = serialise_hs00(original_hist, copy=False)
+        hist = deserialise_hs00(buf)
+
+        assert isinstance(buf, memoryview)
+        assert bytes(buf) == serialise_hs00(original_hist)
+        assert hist["source"] == original_hist["source"]
+        assert np.array_equal(hist["data"], original_hist["data"])
+
+    def test_builder_is_sized_close_to_the_message_size(self):
+        data = np.ones((256, 256), dtype=np.float32)
+        original_hist = {
+            "timestamp": 123456,
+            "current_shape": [256, 256],
+            "dim_metadata": [
+                {"length": 256, "bin_boundaries": np.arange(257, dtype=np.float32)},
+                {"length": 256, "bin_boundaries": np.arange(257, dtype=np.float32)},
+            ],
+            "data": data,
+        }
+        for hist in (original_hist, dict(original_hist, errors=data)):
+            clear_builder_pool()
+
+            buf = serialise_hs00(hist)
+
+            # The builder is created at the estimated size and only grows if the
+            # estimate is too small
+            builder_size = len(get_builder().Bytes)
+            assert len(buf) <= builder_size < 1.05 * len(buf)
+        clear_builder_pool()
+
     def test_schema_type_is_in_global_serialisers_list(self):
         assert "hs00" in SERIALISERS
         assert "hs00" in DESERIALISERS
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import pytest
+import streaming_data_types
+from streaming_data_types import SERIALISERS, DESERIALISERS
+
+
+def _run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+
+# Module level __getattr__ needs Python 3.7, before that everything is imported
+# when the package is
+requires_lazy_import = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="lazy import requires Python 3.7"
+)
+
+
+class TestLazyImport:
+    @requires_lazy_import
+    def test_importing_package_does_not_import_schema_modules(self):
+        loaded = _run_python(
+            "import sys, streaming_data_types; "
+            "print(' '.join(name for name in sys.modules "
+            "if name.startswith('streaming_data_types.') or name in "
+            "('numpy', 'flatbuffers')))"
+        )
+
+        assert loaded.strip() == ""
+
+    @requires_lazy_import
+    def test_using_one_schema_only_imports_its_module(self):
+        loaded = _run_python(
+            "import sys; from streaming_data_types import deserialise_6s4t; "
+            "print(' '.join(name for name in sys.modules "
+            "if name.startswith('streaming_data_types.') and "
+            "not name.startswith('streaming_data_types.fbschemas')))"
+        )
+
+        assert sorted(loaded.split()) == [
+            "streaming_data_types.run_stop_6s4t",
+            "streaming_data_types.utils",
+        ]
+
+    def test_mappings_resolve_to_module_functions(self):
+        from streaming_data_types.run_stop_6s4t import serialise_6s4t, deserialise_6s4t
+
+        assert SERIALISERS["6s4t"] is serialise_6s4t
+        assert DESERIALISERS["6s4t"] is deserialise_6s4t
+        assert streaming_data_types.serialise_6s4t is serialise_6s4t
+        assert len(SERIALISERS) == len(DESERIALISERS) == 10
+
+    def test_star_import_exports_all_schema_functions(self):
+        namespace = {}
+        exec("from streaming_data_types import *", namespace)
+
+        assert namespace["serialise_6s4t"] is SERIALISERS["6s4t"]
+        assert namespace["deserialise_ev42"] is DESERIALISERS["ev42"]
+        assert namespace["deserialise"] is streaming_data_types.deserialise
+        assert {
+            f"{prefix}_{schema}"
+            for schema in SERIALISERS
+            for prefix in ("serialise", "deserialise")
+        } <= set(namespace)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        assert not hasattr(streaming_data_types, "serialise_abcd")
@@ -0,0 +1,88 @@
+import numpy as np
+from streaming_data_types.log_data_filter import F142Filter
+from streaming_data_types.logdata_f142 import deserialise_f142
+
+
+class TestF142Filter:
+    def test_changes_within_absolute_deadband_are_dropped(self):
+        log_filter = F142Filter(absolute_deadband=0.5)
+
+        accepted = [
+            log_filter.accept("source_a", value, timestamp)
+            for timestamp, value in enumerate([1.0, 1.4, 1.6, 1.2, 2.2])
+        ]
+
+        assert accepted == [True, False, True, False, True]
+        assert log_filter.counts("source_a") == {
+            "passed": 3,
+            "dropped_by_deadband": 2,
+            "dropped_by_rate": 0,
+        }
+
+    def test_changes_within_relative_deadband_are_dropped(self):
+        log_filter = F142Filter(relative_deadband=0.1)
+
+        assert log_filter.accept("source_a", 100.0, 0)
+        assert not log_filter.accept("source_a", 109.0, 1)
+        assert log_filter.accept("source_a", 111.0, 2)
+
+    def test_updates_above_max_rate_are_dropped(self):
+        log_filter = F142Filter(max_rate_hz=10)
+
+        accepted = [
+            log_filter.accept("source_a", float(i), timestamp)
+            for i, timestamp in enumerate([0, 50_000_000, 100_000_000, 150_000_000])
+        ]
+
+        assert accepted == [True, False, True, False]
+        assert log_filter.counts("source_a")["dropped_by_rate"] == 2
+
+    def test_array_values_pass_if_any_element_is_outside_deadband(self):
+        log_filter = F142Filter(absolute_deadband=0.5)
+
+        assert log_filter.accept("source_a", np.array([1.0, 2.0, 3.0]), 0)
+        assert not log_filter.accept("source_a", np.array([1.1, 2.1, 3.1]), 1)
+        assert log_filter.accept("source_a", np.array([1.1, 2.1, 3.6]), 2)
+        assert log_filter.accept("source_a", np.array([1.1, 2.1]), 3)
+
+    def test_changes_to_and_from_non_finite_values_pass_deadband(self):
+        log_filter = F142Filter(absolute_deadband=0.5, relative_deadband=0.1)
+
+        accepted = [
+            log_filter.accept("source_a", value, timestamp)
+            for timestamp, value in enumerate(
+                [np.nan, np.nan, 5.0, np.inf, np.inf, 100.0, 100.1, -np.inf]
+            )
+        ]
+
+        assert accepted == [True, False, True, True, False, True, False, True]
+        assert log_filter.accept("source_b", np.array([1.0, np.nan]), 0)
+        assert not log_filter.accept("source_b", np.array([1.1, np.nan]), 1)
+        assert log_filter.accept("source_b", np.array([1.1, 2.0]), 2)
+
+    def test_alarm_changes_and_string_changes_pass_deadband(self):
+        log_filter = F142Filter(absolute_deadband=10)
+
+        assert log_filter.accept("source_a", 1.0, 0)
+        assert log_filter.accept("source_a", 1.0, 1, alarm_status=3, alarm_severity=2)
+        assert log_filter.accept("source_b", "on", 0)
+        assert not log_filter.accept("source_b", "on", 1)
+        assert log_filter.accept("source_b", "off", 2)
+
+    def test_sources_are_filtered_independently(self):
+        log_filter = F142Filter(absolute_deadband=0.5)
+        for i in range(40):
+            log_filter.accept(f"source_{i}", 1.0, 0)
+
+        assert not log_filter.accept("source_0", 1.1, 1)
+        assert log_filter.accept("source_39", 2.0, 1)
+        assert log_filter.dropped == 1
+
+    def test_serialise_returns_message_only_for_passed_updates(self):
+        log_filter = F142Filter(absolute_deadband=0.5)
+
+        first = log_filter.serialise(1.0, "source_a", 10)
+        second = log_filter.serialise(1.1, "source_a", 20)
+
+        assert deserialise_f142(first).value == 1.0
+        assert second is None
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from streaming_data_types.log_data_store import LogDataStore
+from streaming_data_types.logdata_f142 import serialise_f142, serialise_f142_batch
+
+
+class TestLogDataStore:
+    def test_last_value_is_latest_appended(self):
+        store = LogDataStore(capacity=4)
+
+        store.append("source_a", 10, 1.5)
+        store.append("source_a", 20, 2.5)
+
+        assert store.last("source_a") == (20, 2.5)
+        assert store.last("source_b") is None
+
+    def test_oldest_values_are_overwritten_when_full(self):
+        store = LogDataStore(capacity=3)
+
+        for timestamp in range(1, 6):
+            store.append("source_a", timestamp, timestamp * 10)
+
+        timestamps, values = store.query("source_a")
+        assert np.array_equal(timestamps, [3, 4, 5])
+        assert np.array_equal(values, [30, 40, 50])
+
+    def test_time_range_query_spans_wrapped_buffer(self):
+        store = LogDataStore(capacity=5)
+        for timestamp in range(1, 9):
+            store.append("source_a", timestamp * 10, timestamp)
+
+        timestamps, values = store.query("source_a", 50, 80)
+
+        assert np.array_equal(timestamps, [50, 60, 70])
+        assert np.array_equal(values, [5, 6, 7])
+
+    def test_values_older_than_max_age_are_evicted(self):
+        store = LogDataStore(capacity=10, max_age_ns=25)
+
+        for timestamp in (10, 20, 30, 40, 50):
+            store.append("source_a", timestamp, timestamp)
+
+        timestamps, _ = store.query("source_a")
+        assert np.array_equal(timestamps, [30, 40, 50])
+
+    def test_least_recently_updated_source_is_evicted_when_over_memory_budget(self):
+        # Each source's history takes 2 * 16 bytes
+        store = LogDataStore(capacity=2, memory_budget_bytes=64)
+
+        store.append("source_a", 1, 1.0)
+        store.append("source_b", 2, 2.0)
+        store.append("source_a", 3, 3.0)
+        store.append("source_c", 4, 4.0)
+
+        assert store.sources == ["source_a", "source_c"]
+        assert store.nbytes <= 64
+
+    def test_evict_before_removes_old_values_and_empty_sources(self):
+        store = LogDataStore()
+        store.append("source_a", 10, 1.0)
+        store.append("source_a", 30, 3.0)
+        store.append("source_b", 20, 2.0)
+
+        store.evict_before(25)
+
+        assert "source_b" not in store
+        assert np.array_equal(store.query("source_a").timestamp_unix_ns, [30])
+
+    def test_out_of_order_values_are_dropped(self):
+        store = LogDataStore()
+        store.append("source_a", 20, 2.0)
+
+        store.append("source_a", 10, 1.0)
+
+        assert store.dropped == 1
+        assert store.last("source_a") == (20, 2.0)
+
+    def test_f142_messages_are_added(self):
+        store = LogDataStore()
+
+        store.add_f142(serialise_f142(1.5, "source_a", 10))
+        store.add_f142_batch(
+            serialise_f142_batch(["source_a", "source_b"], [2.5, 3.5], [20, 30])
+        )
+
+        assert np.array_equal(store.query("source_a").value, [1.5, 2.5])
+        assert store.last("source_b") == (30, 3.5)
+
+    def test_if_f142_value_is_not_numeric_scalar_then_throws(self):
+        store = LogDataStore()
+
+        with pytest.raises(ValueError):
+            store.add_f142(serialise_f142("a string", "source_a", 10))
+
+    def test_if_memory_budget_is_too_small_for_one_source_then_throws(self):
+        with pytest.raises(ValueError):
+            LogDataStore(capacity=100, memory_budget_bytes=100)
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from streaming_data_types.event_histogrammer import EventHistogrammer
+from streaming_data_types.eventdata_ev42 import serialise_ev42
+from streaming_data_types.histogram_hs00 import deserialise_hs00
+
+parallel_histogrammer = pytest.importorskip(
+    "streaming_data_types.parallel_histogrammer",
+    reason="multiprocessing.shared_memory requires Python 3.8",
+)
+
+
+class TestParallelEventHistogrammer:
+    tof_edges = np.linspace(0, 1000, 11)
+    detector_edges = np.arange(0, 65)
+
+    def _random_messages(self, number_of_messages, events_per_message=1000):
+        rng = np.random.default_rng(0)
+        return [
+            serialise_ev42(
+                "some_source",
+                message_id,
+                100 * message_id,
+                rng.integers(0, 1100, events_per_message).astype(np.uint32),
+                rng.integers(0, 70, events_per_message).astype(np.uint32),
+            )
+            for message_id in range(number_of_messages)
+        ]
+
+    def test_counts_match_single_process_histogrammer(self):
+        messages = self._random_messages(20)
+        expected = EventHistogrammer(self.tof_edges, self.detector_edges)
+        for message in messages:
+            expected.add_ev42(message)
+
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges, self.detector_edges, number_of_workers=2, slot_size=16384
+        ) as histogrammer:
+            for message in messages:
+                histogrammer.add_ev42(message)
+
+            assert np.array_equal(histogrammer.counts, expected.counts)
+            assert histogrammer.last_pulse_time == 1900
+
+    def test_serialised_histogram_round_trips_through_hs00(self):
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges,
+            self.detector_edges,
+            source="some_source",
+            number_of_workers=2,
+            slot_size=16384,
+        ) as histogrammer:
+            for message in self._random_messages(4):
+                histogrammer.add_ev42(message)
+
+            hist = deserialise_hs00(histogrammer.serialise())
+
+            assert hist["source"] == "some_source"
+            assert hist["timestamp"] == 300
+            assert hist["data"].sum() == histogrammer.counts.sum() > 0
+
+    def test_reset_sets_counts_to_zero(self):
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges, self.detector_edges, number_of_workers=2, slot_size=16384
+        ) as histogrammer:
+            for message in self._random_messages(4):
+                histogrammer.add_ev42(message)
+
+            histogrammer.reset()
+
+            assert not histogrammer.counts.any()
+
+    def test_if_message_is_larger_than_slot_then_throws(self):
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges, self.detector_edges, number_of_workers=1, slot_size=1024
+        ) as histogrammer:
+            with pytest.raises(ValueError):
+                histogrammer.add_ev42(self._random_messages(1)[0])
+
+    def test_if_message_cannot_be_histogrammed_then_wait_throws(self):
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges, self.detector_edges, number_of_workers=1, slot_size=16384
+        ) as histogrammer:
+            message = bytearray(serialise_ev42("some_source", 1, 100, [123456789], [1]))
+            # Make the time of flight vector longer than the message
+            length_position = message.find((123456789).to_bytes(4, "little")) - 4
+            message[length_position : length_position + 4] = b"\xff\xff\xff\x0f"
+            histogrammer.add_ev42(message)
+
+            with pytest.raises(RuntimeError):
+                histogrammer.wait()
+
+    def test_if_worker_has_exited_then_wait_throws(self):
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges, self.detector_edges, number_of_workers=1, slot_size=16384
+        ) as histogrammer:
+            worker = histogrammer._workers[0]
+            worker.kill()
+            worker.join()
+            histogrammer.add_ev42(self._random_messages(1)[0])
+
+            with pytest.raises(RuntimeError):
+                histogrammer.wait()
+
+    def test_close_can_be_called_more_than_once(self):
+        with parallel_histogrammer.ParallelEventHistogrammer(
+            self.tof_edges, self.detector_edges, number_of_workers=1, slot_size=16384
+        ) as histogrammer:
+            histogrammer.close()
+
+        histogrammer.close()
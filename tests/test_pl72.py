@@ -1,5 +1,12 @@
+import copy
+import pickle
+import numpy as np
 import pytest
-from streaming_data_types.run_start_pl72 import serialise_pl72, deserialise_pl72
+from streaming_data_types.run_start_pl72 import (
+    serialise_pl72,
+    deserialise_pl72,
+    DetectorSpectrumMap,
+)
 from streaming_data_types import SERIALISERS, DESERIALISERS
 
 
@@ -33,6 +40,82 @@ class TestSerialisationPl72:
             deserialised_tuple.instrument_name == self.original_entry["instrument_name"]
         )
         assert deserialised_tuple.broker == self.original_entry["broker"]
+        assert deserialised_tuple.n_periods == 1
+        assert deserialised_tuple.detector_spectrum_map is None
+
+    def test_serialises_and_deserialises_n_periods_and_detector_spectrum_map(self):
+        spectrum_numbers = np.arange(1, 1000001, dtype=np.int32)
+        detector_ids = np.arange(1000000, 0, -1, dtype=np.int32)
+        buf = serialise_pl72(
+            **self.original_entry,
+            n_periods=3,
+            detector_spectrum_map=DetectorSpectrumMap(
+                spectrum_numbers, detector_ids, len(spectrum_numbers)
+            ),
+        )
+        deserialised_tuple = deserialise_pl72(buf)
+
+        assert deserialised_tuple.n_periods == 3
+        spectrum_map = deserialised_tuple.detector_spectrum_map
+        assert spectrum_map.n_spectra == 1000000
+        assert spectrum_map.spectrum_numbers.dtype == np.int32
+        assert np.array_equal(spectrum_map.spectrum_numbers, spectrum_numbers)
+        assert np.array_equal(spectrum_map.detector_ids, detector_ids)
+        assert deserialised_tuple.job_id == self.original_entry["job_id"]
+
+    def test_nexus_structure_json_is_parsed_once_per_content(self):
+        entry = dict(self.original_entry, nexus_structure='{"children": [1, 2]}')
+        first = deserialise_pl72(serialise_pl72(**entry))
+        second = deserialise_pl72(serialise_pl72(**entry))
+
+        assert first.nexus_structure_json == {"children": [1, 2]}
+        assert second.nexus_structure_json is first.nexus_structure_json
+        assert second.nexus_structure == entry["nexus_structure"]
+
+    def test_run_start_info_behaves_like_a_tuple(self):
+        deserialised_tuple = deserialise_pl72(serialise_pl72(**self.original_entry))
+
+        job_id, filename, *_ = deserialised_tuple
+
+        assert job_id == self.original_entry["job_id"]
+        assert filename == self.original_entry["filename"]
+        assert len(deserialised_tuple) == 11
+        assert deserialised_tuple[5] == self.original_entry["nexus_structure"]
+        assert deserialised_tuple._asdict()["broker"] == self.original_entry["broker"]
+        assert deserialised_tuple == deserialise_pl72(
+            serialise_pl72(**self.original_entry)
+        )
+
+    def test_run_start_info_indexes_hashes_and_replaces_like_a_namedtuple(self):
+        deserialised_tuple = deserialise_pl72(serialise_pl72(**self.original_entry))
+
+        assert deserialised_tuple[0] == self.original_entry["job_id"]
+        assert deserialised_tuple[-3] == self.original_entry["broker"]
+        assert deserialised_tuple[:2] == (
+            self.original_entry["job_id"],
+            self.original_entry["filename"],
+        )
+        assert hash(deserialised_tuple) == hash(tuple(deserialised_tuple))
+        replaced = deserialised_tuple._replace(run_name="other_run")
+        assert replaced.run_name == "other_run"
+        assert replaced.nexus_structure == self.original_entry["nexus_structure"]
+        with pytest.raises(ValueError):
+            deserialised_tuple._replace(not_a_field=1)
+
+    def test_run_start_info_survives_pickle_and_deepcopy_before_decoding(self):
+        entry = dict(self.original_entry, nexus_structure='{"children": [1, 2]}')
+        buf = memoryview(serialise_pl72(**entry))
+
+        for duplicate in (
+            lambda info: pickle.loads(pickle.dumps(info)),
+            copy.deepcopy,
+            copy.copy,
+        ):
+            deserialised_tuple = duplicate(deserialise_pl72(buf))
+
+            assert deserialised_tuple.nexus_structure == entry["nexus_structure"]
+            assert deserialised_tuple.nexus_structure_json == {"children": [1, 2]}
+            assert deserialised_tuple == deserialise_pl72(buf)
 
     def test_if_buffer_has_wrong_id_then_throws(self):
         buf = serialise_pl72(**self.original_entry)
@@ -35,6 +35,15 @@ class TestSerialisationTdct:
             deserialised_tuple.timestamps, self.original_entry["timestamps"]
         )
 
+    def test_serialises_and_deserialises_tdct_message_with_many_timestamps(self):
+        timestamps = np.arange(10000, dtype=np.uint64) + np.uint64(1585332414000000000)
+
+        buf = serialise_tdct("some_name", timestamps)
+        deserialised_tuple = deserialise_tdct(buf)
+
+        assert deserialised_tuple.timestamps.dtype == np.uint64
+        assert np.array_equal(deserialised_tuple.timestamps, timestamps)
+
     def test_if_buffer_has_wrong_id_then_throws(self):
         buf = serialise_tdct(**self.original_entry)
 
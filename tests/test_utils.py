@@ -0,0 +1,101 @@
+import threading
+import numpy as np
+import pytest
+from streaming_data_types.eventdata_ev42 import serialise_ev42, deserialise_ev42
+from streaming_data_types.run_stop_6s4t import serialise_6s4t
+from streaming_data_types.utils import (
+    check_schema_identifier,
+    clear_builder_pool,
+    get_builder,
+    release_builder,
+    reserve_builder_capacity,
+)
+
+
+def _serialise_events(number_of_events):
+    events = np.arange(number_of_events, dtype=np.uint32)
+    return serialise_ev42("some_source", 123456, 567890, events, events)
+
+
+class TestBuilderPool:
+    def setup_method(self):
+        clear_builder_pool()
+
+    def teardown_method(self):
+        clear_builder_pool()
+
+    def test_released_builder_is_reused(self):
+        builder = get_builder()
+        release_builder(builder)
+
+        assert get_builder() is builder
+
+    def test_reused_builder_keeps_grown_capacity(self):
+        _serialise_events(100000)
+        builder = get_builder()
+
+        assert len(builder.Bytes) >= 800000
+
+    def test_reused_builder_produces_identical_output_to_new_builder(self):
+        expected_events = _serialise_events(10)
+        expected_run_stop = serialise_6s4t("some_job")
+        clear_builder_pool()
+
+        _serialise_events(100000)
+        assert _serialise_events(10) == expected_events
+        assert serialise_6s4t("some_job") == expected_run_stop
+
+    def test_reserve_builder_capacity_presizes_builder(self):
+        reserve_builder_capacity(1000000)
+        builder = get_builder()
+
+        assert len(builder.Bytes) >= 1000000
+        assert builder.Offset() == 0
+
+    def test_builder_is_not_reused_while_memoryview_output_is_alive(self):
+        events = np.arange(10, dtype=np.uint32)
+        buf = serialise_ev42("some_source", 1, 2, events, events, copy=False)
+        expected = bytes(buf)
+
+        serialise_ev42("other_source", 3, 4, events[::-1], events[::-1])
+
+        assert bytes(buf) == expected
+        assert deserialise_ev42(buf).source_name == "some_source"
+
+    def test_pools_are_separate_for_each_thread(self):
+        builder = get_builder()
+        release_builder(builder)
+        builders_from_thread = []
+
+        thread = threading.Thread(
+            target=lambda: builders_from_thread.append(get_builder())
+        )
+        thread.start()
+        thread.join()
+
+        assert builders_from_thread[0] is not builder
+        assert get_builder() is builder
+
+
+class TestCheckSchemaIdentifier:
+    buffer = serialise_6s4t("some_job")
+
+    def test_matching_identifier_passes_for_all_buffer_types(self):
+        for buffer in (self.buffer, bytearray(self.buffer), memoryview(self.buffer)):
+            check_schema_identifier(buffer, b"6s4t")
+
+    def test_if_identifier_does_not_match_then_throws_for_all_buffer_types(self):
+        for buffer in (self.buffer, bytearray(self.buffer), memoryview(self.buffer)):
+            with pytest.raises(RuntimeError):
+                check_schema_identifier(buffer, b"ev42")
+
+    def test_if_identifier_is_not_valid_utf8_then_throws(self):
+        buffer = bytearray(self.buffer)
+        buffer[4:8] = b"\xff\xfe\xfd\xfc"
+
+        with pytest.raises(RuntimeError):
+            check_schema_identifier(buffer, b"6s4t")
+
+    def test_if_buffer_is_too_short_then_throws(self):
+        with pytest.raises(RuntimeError):
+            check_schema_identifier(b"\x00\x00\x00\x006s", b"6s4t")